@@ -6,13 +6,14 @@ This module provides:
 - Readiness and liveness probes
 """
 
+import asyncio
 import logging
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from functools import lru_cache
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 from fastapi import APIRouter, Request, Response
 from fastapi.responses import JSONResponse
@@ -23,6 +24,11 @@ from src.shared.database import get_db_session, check_db_health
 
 logger = logging.getLogger(__name__)
 
+# Paths not recorded by MonitoringMiddleware (probes and the metrics endpoints)
+DEFAULT_EXCLUDED_PATHS: frozenset[str] = frozenset(
+    {'/health', '/ready', '/live', '/metrics', '/metrics/reset'}
+)
+
 
 @dataclass
 class RequestMetrics:
@@ -34,8 +40,8 @@ class RequestMetrics:
     # Request counts by endpoint
     endpoint_counts: dict[str, int] = field(default_factory=lambda: defaultdict(int))
 
-    # Latency tracking (in milliseconds)
-    latencies: list[float] = field(default_factory=list)
+    # Latency tracking (in milliseconds); a deque so evicting the oldest sample is O(1)
+    latencies: deque[float] = field(default_factory=deque)
     max_latency_samples: int = 1000
 
     # Error tracking
@@ -43,7 +49,14 @@ class RequestMetrics:
 
     # Timing
     start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    last_request_time: Optional[datetime] = None
+    # Unix timestamp of the last request; converted to a datetime only in get_summary()
+    last_request_time: Optional[float] = None
+
+    # Bumped on every mutation so get_summary() can reuse its last aggregation
+    _version: int = field(default=0, init=False, repr=False)
+    _summary_cache: Optional[tuple[int, dict[str, Any]]] = field(
+        default=None, init=False, repr=False
+    )
 
     def record_request(
         self,
@@ -53,20 +66,21 @@ class RequestMetrics:
         error: Optional[str] = None,
     ) -> None:
         """Record metrics for a completed request."""
+        self._version += 1
         self.status_counts[status_code] += 1
         self.endpoint_counts[endpoint] += 1
-        self.last_request_time = datetime.now(timezone.utc)
+        self.last_request_time = time.time()
 
         # Maintain a rolling window of latencies
-        if len(self.latencies) >= self.max_latency_samples:
-            self.latencies.pop(0)
+        while len(self.latencies) >= self.max_latency_samples:
+            self.latencies.popleft()
         self.latencies.append(latency_ms)
 
         if error:
             self.error_counts[error] += 1
 
-    def get_summary(self) -> dict[str, Any]:
-        """Get a summary of collected metrics."""
+    def _aggregate(self) -> dict[str, Any]:
+        """Compute the request-count and latency aggregates for get_summary()."""
         total_requests = sum(self.status_counts.values())
         success_requests = sum(
             count for code, count in self.status_counts.items()
@@ -83,14 +97,10 @@ class RequestMetrics:
         p95_idx = int(len(latencies) * 0.95)
         p99_idx = int(len(latencies) * 0.99)
 
-        uptime = (datetime.now(timezone.utc) - self.start_time).total_seconds()
-
         return {
             'total_requests': total_requests,
             'success_requests': success_requests,
             'error_requests': error_requests,
-            'success_rate': success_requests / total_requests if total_requests > 0 else 1.0,
-            'requests_per_minute': total_requests / (uptime / 60) if uptime > 0 else 0,
             'latency': {
                 'p50_ms': latencies[p50_idx] if latencies else 0,
                 'p95_ms': latencies[p95_idx] if latencies else 0,
@@ -104,13 +114,45 @@ class RequestMetrics:
             'top_errors': dict(
                 sorted(self.error_counts.items(), key=lambda x: -x[1])[:5]
             ),
+        }
+
+    def get_summary(self) -> dict[str, Any]:
+        """Get a summary of collected metrics.
+
+        Aggregates are recomputed only when requests were recorded since the
+        previous call; uptime-derived fields are always current. Nested dicts
+        are copied so callers cannot mutate the cached aggregates.
+        """
+        if self._summary_cache is None or self._summary_cache[0] != self._version:
+            self._summary_cache = (self._version, self._aggregate())
+        stats = self._summary_cache[1]
+
+        total_requests = stats['total_requests']
+        success_requests = stats['success_requests']
+        uptime = (datetime.now(timezone.utc) - self.start_time).total_seconds()
+
+        return {
+            'total_requests': total_requests,
+            'success_requests': success_requests,
+            'error_requests': stats['error_requests'],
+            'success_rate': success_requests / total_requests if total_requests > 0 else 1.0,
+            'requests_per_minute': total_requests / (uptime / 60) if uptime > 0 else 0,
+            'latency': dict(stats['latency']),
+            'status_codes': dict(stats['status_codes']),
+            'top_endpoints': dict(stats['top_endpoints']),
+            'top_errors': dict(stats['top_errors']),
             'uptime_seconds': uptime,
             'started_at': self.start_time.isoformat(),
-            'last_request_at': self.last_request_time.isoformat() if self.last_request_time else None,
+            'last_request_at': (
+                datetime.fromtimestamp(self.last_request_time, timezone.utc).isoformat()
+                if self.last_request_time is not None else None
+            ),
         }
 
     def reset(self) -> None:
         """Reset all metrics."""
+        self._version += 1
+        self._summary_cache = None
         self.status_counts.clear()
         self.endpoint_counts.clear()
         self.latencies.clear()
@@ -149,16 +191,19 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
     def __init__(
         self,
         app,
-        exclude_paths: Optional[list[str]] = None,
+        exclude_paths: Optional[Iterable[str]] = None,
     ):
         """Initialize the middleware.
 
         Args:
             app: The FastAPI application.
-            exclude_paths: Paths to exclude from metrics (e.g., /health).
+            exclude_paths: Paths to exclude from metrics. Defaults to
+                DEFAULT_EXCLUDED_PATHS (health probes and metrics endpoints).
         """
         super().__init__(app)
-        self.exclude_paths = set(exclude_paths or ['/health', '/ready', '/live'])
+        self.exclude_paths: frozenset[str] = (
+            frozenset(exclude_paths) if exclude_paths is not None else DEFAULT_EXCLUDED_PATHS
+        )
         self.metrics = get_metrics()
 
     async def dispatch(
@@ -173,7 +218,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         if path in self.exclude_paths:
             return await call_next(request)
 
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         error_type = None
 
         try:
@@ -189,7 +234,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
             )
 
         # Calculate latency
-        latency_ms = (time.perf_counter() - start_time) * 1000
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Record metrics
         endpoint = f"{request.method} {path}"
@@ -230,32 +275,7 @@ class HealthCheckRouter:
 
             Checks all registered dependencies and returns detailed status.
             """
-            checks = {}
-            overall_healthy = True
-
-            # Run registered health checks
-            for name, check_func in self._health_checks.items():
-                try:
-                    result = await check_func()
-                    checks[name] = {
-                        'healthy': result.get('healthy', True),
-                        'latency_ms': result.get('latency_ms'),
-                        'details': result.get('details'),
-                    }
-                    if not result.get('healthy', True):
-                        overall_healthy = False
-                except Exception as e:
-                    checks[name] = {
-                        'healthy': False,
-                        'error': str(e),
-                    }
-                    overall_healthy = False
-
-            # Always check database
-            db_check = await self._check_database()
-            checks['database'] = db_check
-            if not db_check.get('healthy', False):
-                overall_healthy = False
+            checks, overall_healthy = await self._run_checks()
 
             return {
                 'status': 'healthy' if overall_healthy else 'unhealthy',
@@ -313,6 +333,56 @@ class HealthCheckRouter:
             metrics.reset()
             return {'status': 'metrics reset'}
 
+    async def _run_checks(self) -> tuple[dict[str, Any], bool]:
+        """Run registered checks and the database check concurrently.
+
+        Returns:
+            Tuple of (per-check results, overall health).
+        """
+        registered = tuple(self._health_checks.items())
+        results = await asyncio.gather(
+            *(self._call_check(check_func) for _, check_func in registered),
+            self._check_database(),
+            return_exceptions=True,
+        )
+
+        checks: dict[str, Any] = {}
+        overall_healthy = True
+
+        for (name, _), result in zip(registered, results):
+            if isinstance(result, BaseException):
+                checks[name] = {
+                    'healthy': False,
+                    'error': str(result),
+                }
+                overall_healthy = False
+                continue
+
+            checks[name] = {
+                'healthy': result.get('healthy', True),
+                'latency_ms': result.get('latency_ms'),
+                'details': result.get('details'),
+            }
+            if not result.get('healthy', True):
+                overall_healthy = False
+
+        # Always check database
+        db_check = results[-1]
+        checks['database'] = db_check
+        if not db_check.get('healthy', False):
+            overall_healthy = False
+
+        return checks, overall_healthy
+
+    @staticmethod
+    async def _call_check(check_func: Callable) -> dict[str, Any]:
+        """Call a registered check inside a coroutine.
+
+        Exceptions raised before the check's first await (or by awaiting a
+        non-awaitable) then surface through gather as a per-check result.
+        """
+        return await check_func()
+
     async def _check_database(self) -> dict[str, Any]:
         """Check database connectivity."""
         start_time = time.perf_counter()
@@ -10,12 +10,15 @@ Security measures:
 - Prompt injection protection via strict LLM prompts
 """
 
-import json
 import logging
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Callable
 
+import orjson
+
 from src.shared.exceptions import (
     AmbiguousCommandError,
     CommandNotFoundError,
@@ -27,7 +30,7 @@ from src.shared.models import SessionType
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandIntent:
     """Parsed command intent with execution details.
 
@@ -72,6 +75,7 @@ class NLPCommandParser:
     MAX_INPUT_LENGTH = 500
     MIN_CONFIDENCE = 0.5
     CONFIRMATION_THRESHOLD = 0.8
+    INTENT_CACHE_MAX = 1024
 
     # Commands that modify state or are irreversible
     DESTRUCTIVE_COMMANDS = frozenset({
@@ -80,6 +84,25 @@ class NLPCommandParser:
         "learn.abandon",
     })
 
+    # Commands offered to the classifier as (command, description, params)
+    NLP_COMMANDS = (
+        ("learn.start", "Start a learning session", "minutes, type"),
+        ("learn.status", "Check current session status", ""),
+        ("learn.end", "End the current session", ""),
+        ("quiz.start", "Start a quiz", "topic, count"),
+        ("explain.start", "Start Feynman explanation", "topic"),
+        ("stats.show", "Show learning progress/stats", ""),
+        ("profile.show", "Show user profile", ""),
+        ("content.search", "Search for learning content", "query"),
+    )
+    AUTHENTICATED_COMMANDS = (
+        ("auth.logout", "Log out", ""),
+        ("auth.whoami", "Show current user", ""),
+    )
+    UNAUTHENTICATED_COMMANDS = (
+        ("auth.login", "Log in (not via NLP)", ""),
+    )
+
     # Dangerous input patterns to block
     DANGEROUS_PATTERNS = [
         (r'[;&|`$]', "shell metacharacters"),
@@ -92,10 +115,49 @@ class NLPCommandParser:
         (r'\x00', "null byte injection"),
     ]
 
+    # All dangerous patterns as one alternation, so input is scanned once.
+    # Each pattern gets a named group; match.lastgroup maps back to it.
+    _DANGEROUS_RE = re.compile(
+        "|".join(f"(?P<p{i}>{pattern})" for i, (pattern, _) in enumerate(DANGEROUS_PATTERNS)),
+        re.IGNORECASE,
+    )
+    _DANGEROUS_GROUPS = {
+        f"p{i}": (pattern, name) for i, (pattern, name) in enumerate(DANGEROUS_PATTERNS)
+    }
+
+    # Fallback extractors used when the LLM omits the topic/query parameter
+    _EXPLAIN_TOPIC_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r"explain\s+(.+)",
+        r"teach\s+me\s+(?:about\s+)?(.+)",
+        r"what\s+is\s+(.+)",
+    ))
+    _SEARCH_QUERY_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r"search\s+(?:for\s+)?(.+)",
+        r"find\s+(.+)",
+        r"look\s+(?:for\s+)?(.+)",
+    ))
+
+    # Markdown code fence around the LLM's JSON; the closing fence is optional
+    _FENCE_RE = re.compile(r"\A```(?:json)?\s*(?P<body>.*?)\s*(?:```)?\Z", re.DOTALL)
+
     def __init__(self) -> None:
         """Initialize the NLP command parser."""
         self._llm = None  # Lazy loaded
         self._command_registry = self._build_command_registry()
+        # Command list and classification prompts depend only on auth state,
+        # so both variants are built once
+        self._available_commands = {
+            is_authenticated: self._format_available_commands(is_authenticated)
+            for is_authenticated in (False, True)
+        }
+        self._system_prompts = {
+            is_authenticated: self._build_system_prompt(is_authenticated)
+            for is_authenticated in (False, True)
+        }
+        # Exact-match LRU of successful classifications
+        self._intent_cache: OrderedDict[
+            tuple[str, bool], tuple[str, float, dict[str, Any]]
+        ] = OrderedDict()
 
     def _get_llm(self):
         """Get LLM service (lazy load)."""
@@ -138,14 +200,14 @@ class NLPCommandParser:
         )
 
         # Step 3: Validate intent exists
-        if intent_type not in self._command_registry:
+        builder = self._command_registry.get(intent_type)
+        if builder is None:
             raise CommandNotFoundError(
                 user_input,
                 suggestion="Try 'learner chat examples' to see available commands"
             )
 
         # Step 4: Build command intent
-        builder = self._command_registry[intent_type]
         intent = builder(sanitized, params)
 
         # Step 5: Determine if confirmation needed
@@ -169,11 +231,10 @@ class NLPCommandParser:
             ValidationError: If input fails security checks
         """
         # Check for empty input
-        if not user_input or not user_input.strip():
+        user_input = user_input.strip() if user_input else ""
+        if not user_input:
             raise ValidationError("input", "Please enter a command")
 
-        user_input = user_input.strip()
-
         # Check length
         if len(user_input) > self.MAX_INPUT_LENGTH:
             raise ValidationError(
@@ -181,19 +242,20 @@ class NLPCommandParser:
                 f"Command too long (max {self.MAX_INPUT_LENGTH} characters)"
             )
 
-        # Check for dangerous patterns
-        for pattern, name in self.DANGEROUS_PATTERNS:
-            if re.search(pattern, user_input, re.IGNORECASE):
-                logger.warning(
-                    f"Blocked dangerous input pattern: {name}",
-                    extra={"pattern": pattern}
-                )
-                raise ValidationError(
-                    "input",
-                    f"Input contains prohibited pattern: {name}"
-                )
+        # Check for dangerous patterns (single scan; reports the leftmost match)
+        match = self._DANGEROUS_RE.search(user_input)
+        if match:
+            pattern, name = self._DANGEROUS_GROUPS[match.lastgroup]
+            logger.warning(
+                f"Blocked dangerous input pattern: {name}",
+                extra={"pattern": pattern}
+            )
+            raise ValidationError(
+                "input",
+                f"Input contains prohibited pattern: {name}"
+            )
 
-        # Normalize whitespace
+        # Normalize whitespace (str.split/join is already a single C-level pass)
         user_input = " ".join(user_input.split())
 
         return user_input
@@ -215,47 +277,18 @@ class NLPCommandParser:
         Raises:
             NLPParseError: If classification fails
         """
-        available_commands = self._get_available_commands(is_authenticated)
-
-        prompt = f"""Classify this user command and extract parameters.
-
-User input: "{user_input}"
-
-Available commands:
-{available_commands}
-
-Respond in this EXACT JSON format only, no other text:
-{{
-    "intent": "command.subcommand",
-    "confidence": 0.95,
-    "params": {{"param_name": "value"}}
-}}
-
-Parameter extraction rules:
-- For time/duration: extract as "minutes" (integer)
-- For session type: extract as "type" (regular/drill/catchup)
-- For topics: extract as "topic" (string)
-- For question count: extract as "count" (integer, default 5)
-- For search queries: extract as "query" (string)
-
-Examples:
-- "start a 30 minute session" -> {{"intent": "learn.start", "confidence": 0.98, "params": {{"minutes": 30}}}}
-- "quiz me on transformers" -> {{"intent": "quiz.start", "confidence": 0.92, "params": {{"topic": "transformers", "count": 5}}}}
-- "show my stats" -> {{"intent": "stats.show", "confidence": 0.95, "params": {{}}}}
-- "log out" -> {{"intent": "auth.logout", "confidence": 0.99, "params": {{}}}}
-
-If the command doesn't match any available command, use:
-{{"intent": "unknown", "confidence": 0.0, "params": {{}}}}"""
+        cache_key = (user_input, is_authenticated)
+        cached = self._intent_cache.get(cache_key)
+        if cached is not None:
+            self._intent_cache.move_to_end(cache_key)
+            intent, confidence, params = cached
+            return intent, confidence, dict(params)
 
         try:
             llm = self._get_llm()
             response = await llm.complete(
-                prompt=prompt,
-                system_prompt=(
-                    "You are a command classifier for a learning CLI. "
-                    "Respond ONLY with valid JSON, no explanation or other text. "
-                    "Be strict about matching commands to the available list."
-                ),
+                prompt=f'User input: "{user_input}"',
+                system_prompt=self._system_prompts[is_authenticated],
                 temperature=0.1,
                 max_tokens=150,
             )
@@ -264,11 +297,11 @@ If the command doesn't match any available command, use:
             content = response.content.strip()
 
             # Handle potential markdown code blocks
-            if content.startswith("```"):
-                content = re.sub(r'^```(?:json)?\s*', '', content)
-                content = re.sub(r'\s*```$', '', content)
+            fence = self._FENCE_RE.match(content)
+            if fence:
+                content = fence.group("body")
 
-            result = json.loads(content)
+            result = orjson.loads(content)
 
             intent = result.get("intent", "unknown")
             confidence = float(result.get("confidence", 0.0))
@@ -284,9 +317,13 @@ If the command doesn't match any available command, use:
                     "I'm not sure what you want to do. Please try rephrasing."
                 )
 
+            self._intent_cache[cache_key] = (intent, confidence, dict(params))
+            if len(self._intent_cache) > self.INTENT_CACHE_MAX:
+                self._intent_cache.popitem(last=False)
+
             return intent, confidence, params
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM JSON response: {e}")
             raise NLPParseError(
                 user_input,
@@ -299,6 +336,47 @@ If the command doesn't match any available command, use:
                 f"Failed to process command: {e}"
             )
 
+    def _build_system_prompt(self, is_authenticated: bool) -> str:
+        """Build the static intent-classification system prompt.
+
+        Args:
+            is_authenticated: Whether to include auth-required commands
+
+        Returns:
+            System prompt with instructions and the available commands
+        """
+        available_commands = self._get_available_commands(is_authenticated)
+
+        return f"""You are a command classifier for a learning CLI. Respond ONLY with valid JSON, no explanation or other text. Be strict about matching commands to the available list.
+
+Classify the user command and extract parameters.
+
+Available commands:
+{available_commands}
+
+Respond in this EXACT JSON format only, no other text:
+{{
+    "intent": "command.subcommand",
+    "confidence": 0.95,
+    "params": {{"param_name": "value"}}
+}}
+
+Parameter extraction rules:
+- For time/duration: extract as "minutes" (integer)
+- For session type: extract as "type" (regular/drill/catchup)
+- For topics: extract as "topic" (string)
+- For question count: extract as "count" (integer, default 5)
+- For search queries: extract as "query" (string)
+
+Examples:
+- "start a 30 minute session" -> {{"intent": "learn.start", "confidence": 0.98, "params": {{"minutes": 30}}}}
+- "quiz me on transformers" -> {{"intent": "quiz.start", "confidence": 0.92, "params": {{"topic": "transformers", "count": 5}}}}
+- "show my stats" -> {{"intent": "stats.show", "confidence": 0.95, "params": {{}}}}
+- "log out" -> {{"intent": "auth.logout", "confidence": 0.99, "params": {{}}}}
+
+If the command doesn't match any available command, use:
+{{"intent": "unknown", "confidence": 0.0, "params": {{}}}}"""
+
     def _get_available_commands(self, is_authenticated: bool) -> str:
         """Get formatted list of available commands.
 
@@ -308,26 +386,21 @@ If the command doesn't match any available command, use:
         Returns:
             Formatted string of available commands
         """
-        commands = [
-            ("learn.start", "Start a learning session", "minutes, type"),
-            ("learn.status", "Check current session status", ""),
-            ("learn.end", "End the current session", ""),
-            ("quiz.start", "Start a quiz", "topic, count"),
-            ("explain.start", "Start Feynman explanation", "topic"),
-            ("stats.show", "Show learning progress/stats", ""),
-            ("profile.show", "Show user profile", ""),
-            ("content.search", "Search for learning content", "query"),
-        ]
+        return self._available_commands[is_authenticated]
 
-        if is_authenticated:
-            commands.extend([
-                ("auth.logout", "Log out", ""),
-                ("auth.whoami", "Show current user", ""),
-            ])
-        else:
-            commands.append(
-                ("auth.login", "Log in (not via NLP)", "")
-            )
+    def _format_available_commands(self, is_authenticated: bool) -> str:
+        """Format the command list shown to the classifier.
+
+        Args:
+            is_authenticated: Whether to include auth-required commands
+
+        Returns:
+            Formatted string of available commands
+        """
+        commands = self.NLP_COMMANDS + (
+            self.AUTHENTICATED_COMMANDS if is_authenticated
+            else self.UNAUTHENTICATED_COMMANDS
+        )
 
         lines = []
         for cmd, desc, params in commands:
@@ -457,14 +530,8 @@ If the command doesn't match any available command, use:
 
         # Try to extract topic from input if not in params
         if not topic:
-            # Common patterns
-            patterns = [
-                r"explain\s+(.+)",
-                r"teach\s+me\s+(?:about\s+)?(.+)",
-                r"what\s+is\s+(.+)",
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, user_input, re.IGNORECASE)
+            for pattern in self._EXPLAIN_TOPIC_PATTERNS:
+                match = pattern.search(user_input)
                 if match:
                     topic = match.group(1).strip()
                     break
@@ -536,13 +603,8 @@ If the command doesn't match any available command, use:
 
         # Extract query from input if not in params
         if not query:
-            patterns = [
-                r"search\s+(?:for\s+)?(.+)",
-                r"find\s+(.+)",
-                r"look\s+(?:for\s+)?(.+)",
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, user_input, re.IGNORECASE)
+            for pattern in self._SEARCH_QUERY_PATTERNS:
+                match = pattern.search(user_input)
                 if match:
                     query = match.group(1).strip()
                     break
@@ -620,10 +682,10 @@ If the command doesn't match any available command, use:
         try:
             minutes = int(minutes)
         except (ValueError, TypeError):
-            minutes = 30  # Default
+            return 30  # Default
 
-        # Clamp to valid range
-        return max(10, min(180, minutes))
+        # Clamp to valid range (comparisons avoid two builtin calls)
+        return 180 if minutes > 180 else 10 if minutes < 10 else minutes
 
     def _validate_session_type(self, stype: Any) -> SessionType:
         """Validate and normalize session type.
@@ -654,14 +716,18 @@ If the command doesn't match any available command, use:
         try:
             count = int(count)
         except (ValueError, TypeError):
-            count = 5  # Default
+            return 5  # Default
 
-        return max(1, min(20, count))
+        return 20 if count > 20 else 1 if count < 1 else count
 
     # =========================================================================
     # Helper Methods
     # =========================================================================
 
+    def intent_cache_clear(self) -> None:
+        """Drop all cached intent classifications."""
+        self._intent_cache.clear()
+
     def get_suggestion(self, failed_input: str) -> str:
         """Get a helpful suggestion for a failed parse.
 
@@ -690,16 +756,13 @@ If the command doesn't match any available command, use:
 
 
 # Factory function
-_parser: NLPCommandParser | None = None
-
-
+@lru_cache(maxsize=1)
 def get_nlp_parser() -> NLPCommandParser:
     """Get the NLP parser singleton.
 
+    Use ``get_nlp_parser.cache_clear()`` to reset it (e.g. in tests).
+
     Returns:
         Shared NLPCommandParser instance
     """
-    global _parser
-    if _parser is None:
-        _parser = NLPCommandParser()
-    return _parser
+    return NLPCommandParser()
@@ -1,12 +1,14 @@
 """Curriculum Agent - Learning path planning and topic recommendations."""
 
-import json
 import re
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
+import orjson
+
 from src.modules.agents.interface import (
     AgentContext,
     AgentResponse,
@@ -124,7 +126,7 @@ class CurriculumAgent(BaseAgent, ICurriculumAgent):
     def agent_type(self) -> AgentType:
         return AgentType.CURRICULUM
 
-    @property
+    @cached_property
     def system_prompt(self) -> str:
         template = self._llm.load_prompt_template("curriculum/learning_path")
         return template.system
@@ -395,8 +397,8 @@ class CurriculumAgent(BaseAgent, ICurriculumAgent):
                 match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", content)
                 if match:
                     content = match.group(1)
-            return json.loads(content)
-        except (json.JSONDecodeError, ValueError):
+            return orjson.loads(content)
+        except (orjson.JSONDecodeError, ValueError):
             return {
                 "title": "Learning Path",
                 "duration_weeks": 4,
@@ -413,8 +415,8 @@ class CurriculumAgent(BaseAgent, ICurriculumAgent):
                 match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", content)
                 if match:
                     content = match.group(1)
-            return json.loads(content)
-        except (json.JSONDecodeError, ValueError):
+            return orjson.loads(content)
+        except (orjson.JSONDecodeError, ValueError):
             return {
                 "recommended_topic_id": str(uuid4()),
                 "topic_title": "Continue Learning",
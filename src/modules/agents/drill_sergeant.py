@@ -1,13 +1,15 @@
 """Drill Sergeant Agent - Targeted practice and skill-building projects."""
 
-import json
 import logging
 import re
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
+import orjson
+
 from src.modules.agents.context_service import get_context_service
 from src.modules.agents.interface import (
     AgentContext,
@@ -162,7 +164,7 @@ class DrillSergeantAgent(BaseAgent):
     def agent_type(self) -> AgentType:
         return AgentType.DRILL_SERGEANT
 
-    @property
+    @cached_property
     def system_prompt(self) -> str:
         template = self._llm.load_prompt_template("drill_sergeant/targeted_practice")
         return template.system
@@ -252,19 +254,21 @@ class DrillSergeantAgent(BaseAgent):
         # Convert to structured format
         exercises = []
         for ex in drill_data.get("exercises", []):
-            exercise = DrillExercise(
+            # Skip promptless exercises before building them
+            prompt = ex.get("prompt")
+            if not prompt:
+                continue
+            exercises.append(DrillExercise(
                 exercise_number=ex.get("exercise_number", len(exercises) + 1),
                 type=ex.get("type", "explain"),
                 difficulty=ex.get("difficulty", 3),
-                prompt=ex.get("prompt", ""),
+                prompt=prompt,
                 correct_answer=ex.get("correct_answer", ""),
                 common_mistakes=ex.get("common_mistakes", []),
                 feedback_if_wrong=ex.get("feedback_if_wrong", "Try again!"),
                 feedback_if_correct=ex.get("feedback_if_correct", "Correct!"),
                 time_limit_seconds=ex.get("time_limit_seconds"),
-            )
-            if exercise.prompt:
-                exercises.append(exercise)
+            ))
 
         drill = TargetedDrill(
             id=uuid4(),
@@ -417,7 +421,7 @@ class DrillSergeantAgent(BaseAgent):
                 match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", content)
                 if match:
                     content = match.group(1)
-            result = json.loads(content)
+            result = orjson.loads(content)
 
             is_correct = result.get("is_correct", False)
             if is_correct:
@@ -429,7 +433,7 @@ class DrillSergeantAgent(BaseAgent):
 
             return is_correct, feedback, next_action
 
-        except (json.JSONDecodeError, ValueError):
+        except (orjson.JSONDecodeError, ValueError):
             # Simple comparison fallback
             is_correct = user_answer.lower().strip() in exercise.correct_answer.lower()
             feedback = exercise.feedback_if_correct if is_correct else exercise.feedback_if_wrong
@@ -469,8 +473,8 @@ class DrillSergeantAgent(BaseAgent):
                 match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", content)
                 if match:
                     content = match.group(1)
-            return json.loads(content)
-        except (json.JSONDecodeError, ValueError):
+            return orjson.loads(content)
+        except (orjson.JSONDecodeError, ValueError):
             return {
                 "drill_title": "Practice Drill",
                 "target_skill": "General",
@@ -484,8 +488,8 @@ class DrillSergeantAgent(BaseAgent):
                 match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", content)
                 if match:
                     content = match.group(1)
-            return json.loads(content)
-        except (json.JSONDecodeError, ValueError):
+            return orjson.loads(content)
+        except (orjson.JSONDecodeError, ValueError):
             return {
                 "project_title": "Skill Building Project",
                 "phases": [],
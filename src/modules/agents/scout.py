@@ -1,12 +1,15 @@
 """Scout Agent - Content discovery, relevance scoring, and summarization."""
 
-import json
 import re
+from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
+import orjson
+
 from src.modules.agents.interface import (
     AgentContext,
     AgentResponse,
@@ -106,13 +109,14 @@ class ScoutAgent(BaseAgent):
         self._llm = llm_service or get_llm_service()
         self._evaluations: dict[UUID, RelevanceEvaluation] = {}
         self._summaries: dict[UUID, ContentSummary] = {}
-        self._user_reading_lists: dict[UUID, list[UUID]] = {}  # user_id -> content_ids
+        # user_id -> content_ids; a dict is used as an insertion-ordered set
+        self._user_reading_lists: defaultdict[UUID, dict[UUID, None]] = defaultdict(dict)
 
     @property
     def agent_type(self) -> AgentType:
         return AgentType.SCOUT
 
-    @property
+    @cached_property
     def system_prompt(self) -> str:
         template = self._llm.load_prompt_template("scout/content_relevance")
         return template.system
@@ -297,7 +301,7 @@ class ScoutAgent(BaseAgent):
             List of recommended content with rationale
         """
         # Get user's reading list
-        reading_list = self._user_reading_lists.get(user_id, [])
+        reading_list = self._user_reading_lists.get(user_id, {})
 
         recommendations = []
         time_allocated = 0
@@ -325,10 +329,7 @@ class ScoutAgent(BaseAgent):
         content_id: UUID,
     ) -> None:
         """Add content to user's reading list."""
-        if user_id not in self._user_reading_lists:
-            self._user_reading_lists[user_id] = []
-        if content_id not in self._user_reading_lists[user_id]:
-            self._user_reading_lists[user_id].append(content_id)
+        self._user_reading_lists[user_id][content_id] = None
 
     def remove_from_reading_list(
         self,
@@ -337,8 +338,7 @@ class ScoutAgent(BaseAgent):
     ) -> None:
         """Remove content from user's reading list."""
         if user_id in self._user_reading_lists:
-            if content_id in self._user_reading_lists[user_id]:
-                self._user_reading_lists[user_id].remove(content_id)
+            self._user_reading_lists[user_id].pop(content_id, None)
 
     def _parse_evaluation(self, content: str) -> dict:
         """Parse evaluation from LLM response."""
@@ -347,8 +347,8 @@ class ScoutAgent(BaseAgent):
                 match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", content)
                 if match:
                     content = match.group(1)
-            return json.loads(content)
-        except (json.JSONDecodeError, ValueError):
+            return orjson.loads(content)
+        except (orjson.JSONDecodeError, ValueError):
             return {
                 "relevance_score": 0.5,
                 "timing_assessment": "tangential",
@@ -363,8 +363,8 @@ class ScoutAgent(BaseAgent):
                 match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", content)
                 if match:
                     content = match.group(1)
-            return json.loads(content)
-        except (json.JSONDecodeError, ValueError):
+            return orjson.loads(content)
+        except (orjson.JSONDecodeError, ValueError):
             return {
                 "headline": "Summary unavailable",
                 "core_insight": "Unable to generate summary",
@@ -645,7 +645,7 @@ class ScoutAgent(BaseAgent):
             self.remove_from_reading_list(context.user_id, UUID(content_id))
             message = "Removed from your reading list."
         else:
-            reading_list = self._user_reading_lists.get(context.user_id, [])
+            reading_list = self._user_reading_lists.get(context.user_id, {})
             if reading_list:
                 message = f"Your reading list has {len(reading_list)} items."
             else:
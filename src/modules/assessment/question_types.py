@@ -10,15 +10,20 @@ simple factual recall, including:
 These question types align with Bloom's taxonomy higher-order thinking levels.
 """
 
+import asyncio
 import logging
 import random
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on question generations (LLM requests) in flight at once
+MAX_CONCURRENT_GENERATIONS = 4
+
 
 class QuestionDifficulty(Enum):
     """Question difficulty levels based on cognitive load."""
@@ -42,7 +47,7 @@ class QuestionType(Enum):
     SYNTHESIS = "synthesis"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuestionOption:
     """An option for multiple-choice questions."""
     text: str
@@ -50,7 +55,7 @@ class QuestionOption:
     explanation: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GeneratedQuestion:
     """A generated assessment question."""
     question_type: QuestionType
@@ -83,6 +88,72 @@ class GeneratedQuestion:
         }
 
 
+def _normalize_topic(topic: str) -> str:
+    """Normalize a topic name for template lookup."""
+    return topic.lower().replace(' ', '_').replace('-', '_')
+
+
+def _build_prototypes(
+    templates_by_topic: dict[str, list[dict]],
+    question_type: QuestionType,
+    context_key: Optional[str] = None,
+    metadata_keys: tuple[str, ...] = (),
+) -> dict[str, tuple[GeneratedQuestion, ...]]:
+    """Build prototype questions from raw templates, keyed by topic.
+
+    Prototypes are built once at import; ``_from_prototype`` fills in the
+    requested topic and difficulty per call.
+    """
+    return {
+        topic: tuple(
+            GeneratedQuestion(
+                question_type=question_type,
+                difficulty=QuestionDifficulty.RECALL,
+                text=template['question'],
+                topic=topic,
+                options=[
+                    QuestionOption(
+                        text=opt['text'],
+                        is_correct=opt['is_correct'],
+                        explanation=opt.get('explanation'),
+                    )
+                    for opt in template['options']
+                ],
+                correct_answer=next(
+                    (opt['text'] for opt in template['options'] if opt['is_correct']),
+                    None
+                ),
+                explanation=template.get('explanation', ''),
+                hints=template.get('hints', []),
+                context=template.get(context_key) if context_key else None,
+                metadata={key: template[key] for key in metadata_keys},
+            )
+            for template in templates
+        )
+        for topic, templates in templates_by_topic.items()
+    }
+
+
+def _from_prototype(
+    prototype: GeneratedQuestion,
+    topic: str,
+    difficulty: QuestionDifficulty,
+) -> GeneratedQuestion:
+    """Copy a prototype question for the requested topic and difficulty.
+
+    The option list, hints and metadata are copied so callers cannot
+    mutate the shared prototype.
+    """
+    return replace(
+        prototype,
+        topic=topic,
+        difficulty=difficulty,
+        options=list(prototype.options),
+        hints=list(prototype.hints),
+        metadata=dict(prototype.metadata),
+    )
+
+
 class QuestionGenerator(ABC):
     """Abstract base class for question generators."""
 
@@ -112,6 +183,66 @@ class QuestionGenerator(ABC):
         pass
 
 
+# Scenario templates for common ML/AI topics
+# This would typically load from a database or file
+_SCENARIO_TEMPLATES: dict[str, list[dict]] = {
+    'neural_networks': [
+        {
+            'scenario': "You're training a neural network for image classification, "
+                       "but validation loss starts increasing while training loss "
+                       "continues to decrease after epoch 15.",
+            'question': "What is the most likely issue and best solution?",
+            'options': [
+                {'text': 'Increase learning rate to speed up convergence',
+                 'is_correct': False,
+                 'explanation': 'This would likely make overfitting worse'},
+                {'text': 'Add dropout layers and implement early stopping',
+                 'is_correct': True,
+                 'explanation': 'Addresses overfitting with regularization'},
+                {'text': 'Add more layers to increase model capacity',
+                 'is_correct': False,
+                 'explanation': 'More capacity would increase overfitting'},
+                {'text': 'Remove the validation set to eliminate the gap',
+                 'is_correct': False,
+                 'explanation': 'This hides the problem rather than solving it'},
+            ],
+            'explanation': 'The divergence between training and validation loss '
+                          'indicates overfitting. Dropout provides regularization '
+                          'and early stopping prevents training past the optimal point.',
+            'hints': ['Consider what the gap between losses indicates',
+                      'Think about regularization techniques'],
+        },
+    ],
+    'transformers': [
+        {
+            'scenario': "You're fine-tuning a BERT model for sentiment analysis "
+                       "on customer reviews. The model performs well on product "
+                       "reviews but poorly on service-related reviews.",
+            'question': "What approach would most likely improve performance?",
+            'options': [
+                {'text': 'Increase the number of training epochs',
+                 'is_correct': False,
+                 'explanation': 'More epochs won\'t help with distribution mismatch'},
+                {'text': 'Add more service-related reviews to training data',
+                 'is_correct': True,
+                 'explanation': 'Addresses the data imbalance directly'},
+                {'text': 'Use a larger BERT variant',
+                 'is_correct': False,
+                 'explanation': 'Model size doesn\'t address data distribution'},
+                {'text': 'Reduce the sequence length',
+                 'is_correct': False,
+                 'explanation': 'Would lose important context'},
+            ],
+            'explanation': 'The performance gap suggests the training data is '
+                          'imbalanced toward product reviews. Adding more diverse '
+                          'service-related examples directly addresses this gap.',
+            'hints': ['Consider what\'s different about the two review types',
+                      'Think about your training data composition'],
+        },
+    ],
+}
+
+
 class ScenarioQuestionGenerator(QuestionGenerator):
     """Generator for scenario-based questions.
 
@@ -125,6 +256,10 @@ class ScenarioQuestionGenerator(QuestionGenerator):
         address this issue?"
     """
 
+    _PROTOTYPES = _build_prototypes(
+        _SCENARIO_TEMPLATES, QuestionType.SCENARIO, context_key='scenario',
+    )
+
     def __init__(self, llm_service=None):
         """Initialize the generator.
 
@@ -251,112 +386,13 @@ Output format (JSON):
     ) -> GeneratedQuestion:
         """Generate question from templates when LLM unavailable."""
         # Template-based scenarios for common topics
-        templates = self._get_scenario_templates(topic)
+        prototypes = self._PROTOTYPES.get(_normalize_topic(topic))
 
-        if not templates:
+        if not prototypes:
             # Generic fallback
             return self._generate_generic_scenario(topic, difficulty)
 
-        template = random.choice(templates)
-        return self._fill_template(template, topic, difficulty)
-
-    def _get_scenario_templates(self, topic: str) -> list[dict]:
-        """Get scenario templates for a topic."""
-        # This would typically load from a database or file
-        # Simplified inline templates for common ML/AI topics
-        templates_by_topic = {
-            'neural_networks': [
-                {
-                    'scenario': "You're training a neural network for image classification, "
-                               "but validation loss starts increasing while training loss "
-                               "continues to decrease after epoch 15.",
-                    'question': "What is the most likely issue and best solution?",
-                    'options': [
-                        {'text': 'Increase learning rate to speed up convergence',
-                         'is_correct': False,
-                         'explanation': 'This would likely make overfitting worse'},
-                        {'text': 'Add dropout layers and implement early stopping',
-                         'is_correct': True,
-                         'explanation': 'Addresses overfitting with regularization'},
-                        {'text': 'Add more layers to increase model capacity',
-                         'is_correct': False,
-                         'explanation': 'More capacity would increase overfitting'},
-                        {'text': 'Remove the validation set to eliminate the gap',
-                         'is_correct': False,
-                         'explanation': 'This hides the problem rather than solving it'},
-                    ],
-                    'explanation': 'The divergence between training and validation loss '
-                                  'indicates overfitting. Dropout provides regularization '
-                                  'and early stopping prevents training past the optimal point.',
-                    'hints': ['Consider what the gap between losses indicates',
-                              'Think about regularization techniques'],
-                },
-            ],
-            'transformers': [
-                {
-                    'scenario': "You're fine-tuning a BERT model for sentiment analysis "
-                               "on customer reviews. The model performs well on product "
-                               "reviews but poorly on service-related reviews.",
-                    'question': "What approach would most likely improve performance?",
-                    'options': [
-                        {'text': 'Increase the number of training epochs',
-                         'is_correct': False,
-                         'explanation': 'More epochs won\'t help with distribution mismatch'},
-                        {'text': 'Add more service-related reviews to training data',
-                         'is_correct': True,
-                         'explanation': 'Addresses the data imbalance directly'},
-                        {'text': 'Use a larger BERT variant',
-                         'is_correct': False,
-                         'explanation': 'Model size doesn\'t address data distribution'},
-                        {'text': 'Reduce the sequence length',
-                         'is_correct': False,
-                         'explanation': 'Would lose important context'},
-                    ],
-                    'explanation': 'The performance gap suggests the training data is '
-                                  'imbalanced toward product reviews. Adding more diverse '
-                                  'service-related examples directly addresses this gap.',
-                    'hints': ['Consider what\'s different about the two review types',
-                              'Think about your training data composition'],
-                },
-            ],
-        }
-
-        # Normalize topic for lookup
-        normalized = topic.lower().replace(' ', '_').replace('-', '_')
-        return templates_by_topic.get(normalized, [])
-
-    def _fill_template(
-        self,
-        template: dict,
-        topic: str,
-        difficulty: QuestionDifficulty,
-    ) -> GeneratedQuestion:
-        """Fill a template to create a question."""
-        options = [
-            QuestionOption(
-                text=opt['text'],
-                is_correct=opt['is_correct'],
-                explanation=opt.get('explanation'),
-            )
-            for opt in template['options']
-        ]
-
-        correct_answer = next(
-            (opt['text'] for opt in template['options'] if opt['is_correct']),
-            None
-        )
-
-        return GeneratedQuestion(
-            question_type=QuestionType.SCENARIO,
-            difficulty=difficulty,
-            text=template['question'],
-            topic=topic,
-            options=options,
-            correct_answer=correct_answer,
-            explanation=template.get('explanation', ''),
-            hints=template.get('hints', []),
-            context=template.get('scenario'),
-        )
+        return _from_prototype(random.choice(prototypes), topic, difficulty)
 
     def _generate_generic_scenario(
         self,
@@ -390,6 +426,59 @@ Output format (JSON):
         )
 
 
+_COMPARISON_PAIRS: dict[str, list[dict]] = {
+    'normalization': [
+        {
+            'concept_a': 'Batch Normalization',
+            'concept_b': 'Layer Normalization',
+            'question': 'When would Layer Normalization be preferred over '
+                       'Batch Normalization?',
+            'options': [
+                {'text': 'When training with very large batch sizes',
+                 'is_correct': False,
+                 'explanation': 'Large batches favor batch normalization'},
+                {'text': 'When working with sequence models like Transformers',
+                 'is_correct': True,
+                 'explanation': 'Layer norm is independent of batch size'},
+                {'text': 'When computational resources are limited',
+                 'is_correct': False,
+                 'explanation': 'Both have similar computational costs'},
+                {'text': 'When using convolutional networks for images',
+                 'is_correct': False,
+                 'explanation': 'CNNs typically use batch normalization'},
+            ],
+            'explanation': 'Layer Normalization normalizes across features '
+                          'rather than the batch dimension, making it ideal '
+                          'for sequence models where batch statistics vary.',
+        },
+    ],
+    'optimizers': [
+        {
+            'concept_a': 'Adam',
+            'concept_b': 'SGD with Momentum',
+            'question': 'In which scenario might SGD with momentum outperform Adam?',
+            'options': [
+                {'text': 'When training on very small datasets',
+                 'is_correct': False,
+                 'explanation': 'Adam\'s adaptivity helps with small data'},
+                {'text': 'When maximum generalization is critical',
+                 'is_correct': True,
+                 'explanation': 'SGD often generalizes better'},
+                {'text': 'When training large language models from scratch',
+                 'is_correct': False,
+                 'explanation': 'Adam is typically preferred for LLMs'},
+                {'text': 'When dealing with sparse gradients',
+                 'is_correct': False,
+                 'explanation': 'Adam handles sparse gradients better'},
+            ],
+            'explanation': 'Research shows SGD with momentum often finds '
+                          'solutions that generalize better to test data, '
+                          'though it may require more careful tuning.',
+        },
+    ],
+}
+
+
 class ComparisonQuestionGenerator(QuestionGenerator):
     """Generator for comparison questions.
 
@@ -401,6 +490,11 @@ class ComparisonQuestionGenerator(QuestionGenerator):
         In which scenario would layer normalization be preferred?"
     """
 
+    _PROTOTYPES = _build_prototypes(
+        _COMPARISON_PAIRS, QuestionType.COMPARISON,
+        metadata_keys=('concept_a', 'concept_b'),
+    )
+
     def __init__(self, llm_service=None):
         """Initialize the generator."""
         self._llm = llm_service
@@ -500,106 +594,12 @@ Output format (JSON):
         context: dict[str, Any],
     ) -> GeneratedQuestion:
         """Generate from templates when LLM unavailable."""
-        comparisons = self._get_comparison_pairs(topic)
+        prototypes = self._PROTOTYPES.get(_normalize_topic(topic))
 
-        if not comparisons:
+        if not prototypes:
             return self._generate_generic_comparison(topic, difficulty)
 
-        pair = random.choice(comparisons)
-        return self._create_comparison_question(pair, topic, difficulty)
-
-    def _get_comparison_pairs(self, topic: str) -> list[dict]:
-        """Get comparison pairs for a topic."""
-        pairs_by_topic = {
-            'normalization': [
-                {
-                    'concept_a': 'Batch Normalization',
-                    'concept_b': 'Layer Normalization',
-                    'question': 'When would Layer Normalization be preferred over '
-                               'Batch Normalization?',
-                    'options': [
-                        {'text': 'When training with very large batch sizes',
-                         'is_correct': False,
-                         'explanation': 'Large batches favor batch normalization'},
-                        {'text': 'When working with sequence models like Transformers',
-                         'is_correct': True,
-                         'explanation': 'Layer norm is independent of batch size'},
-                        {'text': 'When computational resources are limited',
-                         'is_correct': False,
-                         'explanation': 'Both have similar computational costs'},
-                        {'text': 'When using convolutional networks for images',
-                         'is_correct': False,
-                         'explanation': 'CNNs typically use batch normalization'},
-                    ],
-                    'explanation': 'Layer Normalization normalizes across features '
-                                  'rather than the batch dimension, making it ideal '
-                                  'for sequence models where batch statistics vary.',
-                },
-            ],
-            'optimizers': [
-                {
-                    'concept_a': 'Adam',
-                    'concept_b': 'SGD with Momentum',
-                    'question': 'In which scenario might SGD with momentum outperform Adam?',
-                    'options': [
-                        {'text': 'When training on very small datasets',
-                         'is_correct': False,
-                         'explanation': 'Adam\'s adaptivity helps with small data'},
-                        {'text': 'When maximum generalization is critical',
-                         'is_correct': True,
-                         'explanation': 'SGD often generalizes better'},
-                        {'text': 'When training large language models from scratch',
-                         'is_correct': False,
-                         'explanation': 'Adam is typically preferred for LLMs'},
-                        {'text': 'When dealing with sparse gradients',
-                         'is_correct': False,
-                         'explanation': 'Adam handles sparse gradients better'},
-                    ],
-                    'explanation': 'Research shows SGD with momentum often finds '
-                                  'solutions that generalize better to test data, '
-                                  'though it may require more careful tuning.',
-                },
-            ],
-        }
-
-        normalized = topic.lower().replace(' ', '_').replace('-', '_')
-        return pairs_by_topic.get(normalized, [])
-
-    def _create_comparison_question(
-        self,
-        pair: dict,
-        topic: str,
-        difficulty: QuestionDifficulty,
-    ) -> GeneratedQuestion:
-        """Create a question from a comparison pair."""
-        options = [
-            QuestionOption(
-                text=opt['text'],
-                is_correct=opt['is_correct'],
-                explanation=opt.get('explanation'),
-            )
-            for opt in pair['options']
-        ]
-
-        correct_answer = next(
-            (opt['text'] for opt in pair['options'] if opt['is_correct']),
-            None
-        )
-
-        return GeneratedQuestion(
-            question_type=QuestionType.COMPARISON,
-            difficulty=difficulty,
-            text=pair['question'],
-            topic=topic,
-            options=options,
-            correct_answer=correct_answer,
-            explanation=pair.get('explanation', ''),
-            hints=pair.get('hints', []),
-            metadata={
-                'concept_a': pair['concept_a'],
-                'concept_b': pair['concept_b'],
-            },
-        )
+        return _from_prototype(random.choice(prototypes), topic, difficulty)
 
     def _generate_generic_comparison(
         self,
@@ -632,6 +632,35 @@ Output format (JSON):
         )
 
 
+_APPLICATION_TEMPLATES: dict[str, list[dict]] = {
+    'attention': [
+        {
+            'problem': "You need to build a model that processes "
+                      "documents of varying lengths efficiently.",
+            'question': "How would you apply attention mechanisms "
+                       "to handle variable-length input?",
+            'options': [
+                {'text': 'Use fixed-size padding for all documents',
+                 'is_correct': False,
+                 'explanation': 'Wasteful and doesn\'t leverage attention'},
+                {'text': 'Apply attention masks to handle varying lengths',
+                 'is_correct': True,
+                 'explanation': 'Standard approach for variable sequences'},
+                {'text': 'Truncate all documents to minimum length',
+                 'is_correct': False,
+                 'explanation': 'Loses important information'},
+                {'text': 'Process each word independently',
+                 'is_correct': False,
+                 'explanation': 'Ignores contextual relationships'},
+            ],
+            'explanation': 'Attention masks allow models to process '
+                          'variable-length sequences by masking padding '
+                          'tokens, maintaining computational efficiency.',
+        },
+    ],
+}
+
+
 class ApplicationQuestionGenerator(QuestionGenerator):
     """Generator for application questions.
 
@@ -639,6 +668,10 @@ class ApplicationQuestionGenerator(QuestionGenerator):
     to solve specific problems.
     """
 
+    _PROTOTYPES = _build_prototypes(
+        _APPLICATION_TEMPLATES, QuestionType.APPLICATION, context_key='problem',
+    )
+
     def __init__(self, llm_service=None):
         """Initialize the generator."""
         self._llm = llm_service
@@ -657,80 +690,13 @@ class ApplicationQuestionGenerator(QuestionGenerator):
         context = context or {}
 
         # Application questions focus on "how to use" knowledge
-        templates = self._get_application_templates(topic)
+        prototypes = self._PROTOTYPES.get(_normalize_topic(topic))
 
-        if templates:
-            template = random.choice(templates)
-            return self._fill_template(template, topic, difficulty)
+        if prototypes:
+            return _from_prototype(random.choice(prototypes), topic, difficulty)
 
         return self._generate_generic_application(topic, difficulty)
 
-    def _get_application_templates(self, topic: str) -> list[dict]:
-        """Get application templates for a topic."""
-        templates_by_topic = {
-            'attention': [
-                {
-                    'problem': "You need to build a model that processes "
-                              "documents of varying lengths efficiently.",
-                    'question': "How would you apply attention mechanisms "
-                               "to handle variable-length input?",
-                    'options': [
-                        {'text': 'Use fixed-size padding for all documents',
-                         'is_correct': False,
-                         'explanation': 'Wasteful and doesn\'t leverage attention'},
-                        {'text': 'Apply attention masks to handle varying lengths',
-                         'is_correct': True,
-                         'explanation': 'Standard approach for variable sequences'},
-                        {'text': 'Truncate all documents to minimum length',
-                         'is_correct': False,
-                         'explanation': 'Loses important information'},
-                        {'text': 'Process each word independently',
-                         'is_correct': False,
-                         'explanation': 'Ignores contextual relationships'},
-                    ],
-                    'explanation': 'Attention masks allow models to process '
-                                  'variable-length sequences by masking padding '
-                                  'tokens, maintaining computational efficiency.',
-                },
-            ],
-        }
-
-        normalized = topic.lower().replace(' ', '_').replace('-', '_')
-        return templates_by_topic.get(normalized, [])
-
-    def _fill_template(
-        self,
-        template: dict,
-        topic: str,
-        difficulty: QuestionDifficulty,
-    ) -> GeneratedQuestion:
-        """Fill a template to create a question."""
-        options = [
-            QuestionOption(
-                text=opt['text'],
-                is_correct=opt['is_correct'],
-                explanation=opt.get('explanation'),
-            )
-            for opt in template['options']
-        ]
-
-        correct_answer = next(
-            (opt['text'] for opt in template['options'] if opt['is_correct']),
-            None
-        )
-
-        return GeneratedQuestion(
-            question_type=QuestionType.APPLICATION,
-            difficulty=difficulty,
-            text=template['question'],
-            topic=topic,
-            options=options,
-            correct_answer=correct_answer,
-            explanation=template.get('explanation', ''),
-            hints=template.get('hints', []),
-            context=template.get('problem'),
-        )
-
     def _generate_generic_application(
         self,
         topic: str,
@@ -762,6 +728,15 @@ class ApplicationQuestionGenerator(QuestionGenerator):
         )
 
 
+@lru_cache(maxsize=32)
+def _cached_generator(
+    generator_class: type[QuestionGenerator],
+    llm_service=None,
+) -> QuestionGenerator:
+    """Create a generator, memoized per class and LLM service."""
+    return generator_class(llm_service=llm_service)
+
+
 class QuestionGeneratorFactory:
     """Factory for creating question generators."""
 
@@ -783,6 +758,9 @@ class QuestionGeneratorFactory:
             question_type: The type of questions to generate.
             llm_service: Optional LLM service for dynamic generation.
 
+        Generators hold no state beyond the LLM service, so instances are
+        reused per (generator class, LLM service) pair.
+
         Returns:
             A question generator instance.
 
@@ -793,7 +771,11 @@ class QuestionGeneratorFactory:
         if generator_class is None:
             raise ValueError(f"Unsupported question type: {question_type}")
 
-        return generator_class(llm_service=llm_service)
+        try:
+            return _cached_generator(generator_class, llm_service)
+        except TypeError:
+            # Unhashable LLM service; build an uncached instance
+            return generator_class(llm_service=llm_service)
 
     @classmethod
     def get_supported_types(cls) -> list[QuestionType]:
@@ -820,18 +802,32 @@ async def generate_mixed_questions(
     Returns:
         List of generated questions.
     """
-    questions = []
     types = QuestionGeneratorFactory.get_supported_types()
+    # Rotate through question types
+    q_types = [types[i % len(types)] for i in range(count)]
 
-    for i in range(count):
-        # Rotate through question types
-        q_type = types[i % len(types)]
-        generator = QuestionGeneratorFactory.create(q_type, llm_service)
+    # Generators are independent, so run them concurrently, but bounded so a
+    # large count doesn't burst the LLM API
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_GENERATIONS)
 
-        try:
-            question = await generator.generate(topic, difficulty)
-            questions.append(question)
-        except Exception as e:
-            logger.warning(f"Failed to generate {q_type.value} question: {e}")
+    async def _generate(q_type: QuestionType) -> GeneratedQuestion:
+        async with semaphore:
+            generator = QuestionGeneratorFactory.create(q_type, llm_service)
+            return await generator.generate(topic, difficulty)
+
+    results = await asyncio.gather(
+        *(_generate(q_type) for q_type in q_types),
+        return_exceptions=True,
+    )
+
+    questions = []
+    for q_type, result in zip(q_types, results):
+        if isinstance(result, BaseException):
+            # Cancellation and interpreter exits are not generation failures
+            if not isinstance(result, Exception):
+                raise result
+            logger.warning(f"Failed to generate {q_type.value} question: {result}")
+        else:
+            questions.append(result)
 
     return questions
@@ -243,8 +243,8 @@ class PlaceholderEmbedding(EmbeddingService):
         """Generate deterministic placeholder embedding using MD5 hash.
 
         The embedding is generated by:
-        1. Computing MD5 hash of the text (32 hex chars)
-        2. Converting hex pairs to floats in [0, 1] range
+        1. Computing MD5 digest of the text (16 bytes)
+        2. Converting each byte to a float in [0, 1] range
         3. Padding with zeros to reach 1536 dimensions
 
         Args:
@@ -256,20 +256,14 @@ class PlaceholderEmbedding(EmbeddingService):
         if not text:
             return [0.0] * self.dimension
 
-        # Generate MD5 hash
-        hash_val = hashlib.md5(text.encode()).hexdigest()
-
-        # Convert hex pairs to floats (32 chars = 16 float values)
-        embedding = []
-        for i in range(0, 32, 2):
-            # Convert hex pair to int (0-255), then normalize to [0, 1]
-            value = int(hash_val[i:i+2], 16) / 255.0
-            embedding.append(value)
+        # Generate MD5 digest and normalize each byte (0-255) to [0, 1]
+        digest = hashlib.md5(text.encode()).digest()
+        embedding = [byte / 255.0 for byte in digest]
 
         # Pad with zeros to reach target dimension
         embedding.extend([0.0] * (self.dimension - len(embedding)))
 
-        return embedding[:self.dimension]
+        return embedding
 
     async def batch_generate(self, texts: list[str]) -> list[list[float]]:
         """Generate placeholder embeddings for multiple texts.
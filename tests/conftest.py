@@ -1,7 +1,9 @@
 """Test configuration and fixtures."""
 
+import itertools
 import sys
 from pathlib import Path
+from uuid import UUID
 
 # Load environment variables before any imports that need them
 from dotenv import load_dotenv
@@ -12,7 +14,20 @@ load_dotenv(project_root / ".env")
 sys.path.insert(0, str(project_root))
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+# Deterministic test IDs from one process-wide counter; it never wraps, so
+# every ID handed out during a run is distinct
+_TEST_ID_COUNTER = itertools.count(1)
+
+# The counter starts at 1, so this never matches a stored record
+MISSING_TEST_UUID = UUID(int=0)
+
+
+def next_test_uuid() -> UUID:
+    """Return the next deterministic test UUID."""
+    return UUID(int=next(_TEST_ID_COUNTER))
 
 
 # Use session-scoped event loop to avoid "Event loop is closed" errors
@@ -38,6 +53,32 @@ async def reset_db_engine():
         database._session_factory = None
 
 
+@pytest.fixture
+async def db_transaction():
+    """Run a test inside a database transaction that is rolled back afterwards.
+
+    Sessions opened through get_db_session() join the outer transaction via
+    savepoints, so their commits are discarded with it and tests need no
+    DELETE-based cleanup. Yields the connection so tests can seed data on it
+    directly.
+    """
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from src.shared import database
+
+    async with database.get_engine().connect() as conn:
+        transaction = await conn.begin()
+        factory = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        with patch.object(database, "get_session_factory", return_value=factory):
+            yield conn
+        await transaction.rollback()
+
+
 @pytest.fixture
 def mock_supabase():
     """Mock Supabase client."""
@@ -47,6 +88,50 @@ def mock_supabase():
     return client
 
 
+class StubLLMService:
+    """Lightweight stand-in for LLMService.
+
+    Avoids the attribute-proxy overhead of MagicMock/AsyncMock on the
+    complete() path. Set ``next_response`` to control what completions
+    return; calls and loaded template names are recorded for assertions.
+    """
+
+    def __init__(self) -> None:
+        from src.modules.llm.service import LLMResponse, PromptTemplate
+
+        self.next_response = LLMResponse(
+            content="Mock LLM response",
+            model="claude-sonnet-4-20250514",
+            usage={"input_tokens": 100, "output_tokens": 50},
+        )
+        self.prompt_template = PromptTemplate(
+            name="test",
+            system="Test system prompt",
+            user="Test user prompt",
+            variables=[],
+        )
+        self.calls: list[dict] = []
+        self.template_names: list[str] = []
+
+    async def complete(self, *args, **kwargs):
+        self.calls.append(kwargs)
+        return self.next_response
+
+    async def complete_with_history(self, *args, **kwargs):
+        self.calls.append(kwargs)
+        return self.next_response
+
+    def load_prompt_template(self, name: str):
+        self.template_names.append(name)
+        return self.prompt_template
+
+
+@pytest.fixture
+def stub_llm_service():
+    """Lightweight stub LLM service."""
+    return StubLLMService()
+
+
 @pytest.fixture
 def mock_llm_service():
     """Mock LLM service."""
@@ -9,6 +9,9 @@ from src.modules.auth import get_auth_service
 from src.modules.auth.models import UserModel, RefreshTokenModel, PasswordResetTokenModel
 from src.shared.database import get_db_session
 
+# These tests share database tables; keep them on one worker under `pytest -n`
+pytestmark = pytest.mark.xdist_group("database")
+
 
 @pytest.fixture
 async def auth_service():
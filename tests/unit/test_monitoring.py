@@ -1,11 +1,13 @@
 """Unit tests for monitoring middleware."""
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 
 from fastapi import FastAPI, Request
-from fastapi.testclient import TestClient
 
 from src.api.middleware.monitoring import (
     RequestMetrics,
@@ -17,6 +19,49 @@ from src.api.middleware.monitoring import (
 )
 
 
+async def call_asgi(app, method: str, path: str) -> list[dict]:
+    """Invoke an ASGI app directly and return the messages it sent."""
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+    messages: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages
+
+
+def response_status(messages: list[dict]) -> int:
+    """Get the status code from collected ASGI messages."""
+    return messages[0]["status"]
+
+
+def response_headers(messages: list[dict]) -> dict[str, str]:
+    """Get the response headers from collected ASGI messages."""
+    return {k.decode().lower(): v.decode() for k, v in messages[0]["headers"]}
+
+
+def response_json(messages: list[dict]):
+    """Decode the JSON body from collected ASGI messages."""
+    body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    return json.loads(body)
+
+
 class TestRequestMetrics:
     """Tests for RequestMetrics class."""
 
@@ -32,7 +77,7 @@ class TestRequestMetrics:
         metrics = RequestMetrics()
         assert metrics.status_counts == {}
         assert metrics.endpoint_counts == {}
-        assert metrics.latencies == []
+        assert list(metrics.latencies) == []
 
     def test_record_request(self):
         """Test recording a request."""
@@ -69,7 +114,7 @@ class TestRequestMetrics:
             metrics.record_request(200, "/test", float(i))
 
         assert len(metrics.latencies) == 5
-        assert metrics.latencies == [5.0, 6.0, 7.0, 8.0, 9.0]
+        assert list(metrics.latencies) == [5.0, 6.0, 7.0, 8.0, 9.0]
 
     def test_get_summary(self):
         """Test getting metrics summary."""
@@ -88,6 +133,42 @@ class TestRequestMetrics:
         assert "latency" in summary
         assert summary["latency"]["avg_ms"] == 95  # (50+100+30+200)/4
 
+    def test_get_summary_reuses_aggregates(self):
+        """Test repeat summaries reuse aggregates until a new request is recorded."""
+        metrics = RequestMetrics()
+        metrics.record_request(200, "GET /a", 50)
+
+        with patch.object(metrics, "_aggregate", wraps=metrics._aggregate) as aggregate:
+            first = metrics.get_summary()
+            second = metrics.get_summary()
+            assert aggregate.call_count == 1
+            assert second["latency"] == first["latency"]
+
+            metrics.record_request(200, "GET /a", 150)
+            third = metrics.get_summary()
+            assert aggregate.call_count == 2
+
+        assert third["total_requests"] == 2
+        assert third["latency"]["avg_ms"] == 100
+
+    def test_get_summary_returns_copies(self):
+        """Test mutating a summary does not corrupt later summaries."""
+        metrics = RequestMetrics()
+        metrics.record_request(200, "GET /a", 50)
+        metrics.record_request(500, "GET /b", 100, error="Error")
+
+        first = metrics.get_summary()
+        first["latency"]["avg_ms"] = -1
+        first["status_codes"].clear()
+        first["top_endpoints"]["GET /c"] = 99
+        first["top_errors"].pop("Error")
+
+        second = metrics.get_summary()
+        assert second["latency"]["avg_ms"] == 75
+        assert second["status_codes"] == {200: 1, 500: 1}
+        assert second["top_endpoints"] == {"GET /a": 1, "GET /b": 1}
+        assert second["top_errors"] == {"Error": 1}
+
     def test_reset(self):
         """Test resetting metrics."""
         metrics = RequestMetrics()
@@ -95,7 +176,7 @@ class TestRequestMetrics:
         metrics.reset()
 
         assert metrics.status_counts == {}
-        assert metrics.latencies == []
+        assert list(metrics.latencies) == []
 
 
 class TestGetMetrics:
@@ -142,24 +223,25 @@ class TestMonitoringMiddleware:
         app.add_middleware(MonitoringMiddleware)
         return app
 
-    @pytest.fixture
-    def client(self, app):
-        """Create test client."""
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        """Reset metrics before each test."""
         reset_metrics()
-        return TestClient(app)
 
-    def test_records_successful_request(self, client):
+    @pytest.mark.asyncio
+    async def test_records_successful_request(self, app):
         """Test middleware records successful requests."""
-        response = client.get("/test")
-        assert response.status_code == 200
+        messages = await call_asgi(app, "GET", "/test")
+        assert response_status(messages) == 200
 
         metrics = get_metrics()
         assert metrics.status_counts[200] >= 1
-        assert "X-Response-Time" in response.headers
+        assert "x-response-time" in response_headers(messages)
 
-    def test_excludes_health_endpoint(self, client):
+    @pytest.mark.asyncio
+    async def test_excludes_health_endpoint(self, app):
         """Test middleware excludes health endpoint."""
-        client.get("/health")
+        await call_asgi(app, "GET", "/health")
 
         metrics = get_metrics()
         # Health endpoint should not be recorded
@@ -184,63 +266,68 @@ class TestHealthCheckRouter:
         app.include_router(health_router.get_router())
         return app
 
-    @pytest.fixture
-    def client(self, app):
-        """Create test client."""
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        """Reset metrics before each test."""
         reset_metrics()
-        return TestClient(app)
 
-    def test_health_endpoint(self, client, mock_db_health):
+    @pytest.mark.asyncio
+    async def test_health_endpoint(self, app, mock_db_health):
         """Test /health endpoint."""
-        response = client.get("/health")
-        assert response.status_code == 200
+        messages = await call_asgi(app, "GET", "/health")
+        assert response_status(messages) == 200
 
-        data = response.json()
+        data = response_json(messages)
         assert "status" in data
         assert "checks" in data
         assert "database" in data["checks"]
 
-    def test_ready_endpoint_success(self, client, mock_db_health):
+    @pytest.mark.asyncio
+    async def test_ready_endpoint_success(self, app, mock_db_health):
         """Test /ready endpoint when healthy."""
-        response = client.get("/ready")
-        assert response.status_code == 200
+        messages = await call_asgi(app, "GET", "/ready")
+        assert response_status(messages) == 200
 
-        data = response.json()
+        data = response_json(messages)
         assert data["status"] == "ready"
 
-    def test_ready_endpoint_failure(self, client, mock_db_health):
+    @pytest.mark.asyncio
+    async def test_ready_endpoint_failure(self, app, mock_db_health):
         """Test /ready endpoint when database unavailable."""
         mock_db_health.return_value = False
 
-        response = client.get("/ready")
+        messages = await call_asgi(app, "GET", "/ready")
         # Ready should return 503 when not ready
-        assert response.status_code in (200, 503)
+        assert response_status(messages) in (200, 503)
 
-    def test_live_endpoint(self, client, mock_db_health):
+    @pytest.mark.asyncio
+    async def test_live_endpoint(self, app, mock_db_health):
         """Test /live endpoint."""
-        response = client.get("/live")
-        assert response.status_code == 200
+        messages = await call_asgi(app, "GET", "/live")
+        assert response_status(messages) == 200
 
-        data = response.json()
+        data = response_json(messages)
         assert data["status"] == "alive"
 
-    def test_metrics_endpoint(self, client, mock_db_health):
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint(self, app, mock_db_health):
         """Test /metrics endpoint."""
-        response = client.get("/metrics")
-        assert response.status_code == 200
+        messages = await call_asgi(app, "GET", "/metrics")
+        assert response_status(messages) == 200
 
-        data = response.json()
+        data = response_json(messages)
         assert "total_requests" in data
         assert "latency" in data
 
-    def test_metrics_reset_endpoint(self, client, mock_db_health):
+    @pytest.mark.asyncio
+    async def test_metrics_reset_endpoint(self, app, mock_db_health):
         """Test /metrics/reset endpoint."""
         # First record some metrics
         metrics = get_metrics()
         metrics.record_request(200, "/test", 50)
 
-        response = client.post("/metrics/reset")
-        assert response.status_code == 200
+        messages = await call_asgi(app, "POST", "/metrics/reset")
+        assert response_status(messages) == 200
 
         # Verify reset
         metrics_after = get_metrics()
@@ -288,3 +375,59 @@ class TestHealthCheckIntegration:
         # Trigger health check via endpoint would call custom check
         # This tests the registration mechanism
         assert health_router._health_checks["custom"] is custom_check
+
+    @pytest.mark.asyncio
+    async def test_checks_run_concurrently(self, health_router):
+        """Test registered checks and the database check run concurrently."""
+        # Each check waits until all three have started; run one at a time,
+        # the first would never get past the barrier
+        barrier = asyncio.Barrier(3)
+
+        async def waiting_check():
+            await barrier.wait()
+            return {"healthy": True}
+
+        health_router.register_check("first", waiting_check)
+        health_router.register_check("second", waiting_check)
+        health_router._check_database = waiting_check
+
+        checks, healthy = await asyncio.wait_for(health_router._run_checks(), timeout=5)
+
+        assert healthy is True
+        assert list(checks) == ["first", "second", "database"]
+
+    @pytest.mark.asyncio
+    async def test_failing_check_marks_unhealthy(self, health_router):
+        """Test a raising check is reported without aborting the others."""
+        async def broken_check():
+            raise RuntimeError("boom")
+
+        async def db_check():
+            return {"healthy": True}
+
+        health_router.register_check("broken", broken_check)
+        health_router._check_database = db_check
+
+        checks, healthy = await health_router._run_checks()
+
+        assert healthy is False
+        assert checks["broken"] == {"healthy": False, "error": "boom"}
+        assert checks["database"]["healthy"] is True
+
+    @pytest.mark.asyncio
+    async def test_synchronously_raising_check_marks_unhealthy(self, health_router):
+        """Test a check that raises before returning an awaitable is contained."""
+        def broken_check():
+            raise RuntimeError("boom")
+
+        async def db_check():
+            return {"healthy": True}
+
+        health_router.register_check("broken", broken_check)
+        health_router._check_database = db_check
+
+        checks, healthy = await health_router._run_checks()
+
+        assert healthy is False
+        assert checks["broken"] == {"healthy": False, "error": "boom"}
+        assert checks["database"]["healthy"] is True
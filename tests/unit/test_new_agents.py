@@ -2,8 +2,6 @@
 
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
 
 from src.modules.agents.interface import (
     AgentContext,
@@ -12,45 +10,57 @@ from src.modules.agents.interface import (
 )
 from src.modules.agents.curriculum import CurriculumAgent, UserLearningState
 from src.modules.agents.scout import ScoutAgent, ContentItem, UserContentProfile
-from src.modules.agents.drill_sergeant import DrillSergeantAgent, WeaknessAnalysis
-from src.modules.llm.service import LLMResponse, PromptTemplate
+from src.modules.agents.drill_sergeant import (
+    DrillExercise,
+    DrillSergeantAgent,
+    TargetedDrill,
+    WeaknessAnalysis,
+)
+from src.modules.llm.service import LLMResponse
+from tests.conftest import next_test_uuid
 
 
-# Fixtures
+# Helpers
 
+_BASE_USAGE = {"input_tokens": 100, "output_tokens": 50}
 
-@pytest.fixture
-def mock_llm_service():
-    """Create a mock LLM service."""
-    mock = MagicMock()
 
-    # Mock complete method - use AsyncMock without side_effect so it can be overridden
-    mock.complete = AsyncMock(return_value=LLMResponse(
-        content="Mock LLM response",
-        model="claude-sonnet-4-20250514",
-        usage={"input_tokens": 100, "output_tokens": 50},
-    ))
-    mock.complete_with_history = AsyncMock(return_value=LLMResponse(
-        content="Mock LLM response",
+def _llm(content: str, usage: dict[str, int] | None = None) -> LLMResponse:
+    """Build a mock LLM response with the default model and token usage."""
+    return LLMResponse(
+        content=content,
         model="claude-sonnet-4-20250514",
-        usage={"input_tokens": 100, "output_tokens": 50},
-    ))
-    mock.load_prompt_template = MagicMock(return_value=PromptTemplate(
-        name="test",
-        system="Test system prompt",
-        user="Test user prompt",
-        variables=[],
-    ))
+        usage={**_BASE_USAGE} if usage is None else usage,
+    )
+
+
+# Canned LLM JSON payloads
 
-    return mock
+_CURRICULUM_PATH_JSON = '{"title": "Test Path", "duration_weeks": 4, "total_hours": 20, "phases": [], "weekly_schedule": [], "success_criteria": []}'
+_RECOMMENDATION_JSON = '{"recommended_topic_id": "123", "topic_title": "Functions", "recommendation_type": "path_continuation", "rationale": "Next step", "activity_type": "read", "estimated_minutes": 30, "difficulty_level": 3, "goal_alignment": "Good fit", "session_structure": []}'
+_AI_PATH_JSON = '{"title": "AI Learning Path", "duration_weeks": 4, "total_hours": 20, "phases": [{"title": "Phase 1", "milestone": "Basic understanding"}], "weekly_schedule": [], "success_criteria": []}'
+_EVALUATION_JSON = '{"relevance_score": 0.8, "timing_assessment": "perfect_timing", "recommended_action": "read_now", "rationale": "Highly relevant", "goal_alignment": {}, "prerequisite_check": {}, "practical_value": {}, "when_to_consume": "immediate", "estimated_time_investment": 15, "key_takeaways": ["Key point"]}'
+_SUMMARY_JSON = '{"headline": "Key insight here", "core_insight": "Main point explained", "key_concepts": [{"concept": "Backprop", "explanation": "How gradients flow"}], "practical_application": {}, "prerequisites": {}, "technical_details": {}, "connections": {}, "full_summary": "Full summary text", "follow_up_questions": ["Question 1"], "time_saved": 10}'
+_DRILL_JSON = '{"drill_title": "Backpropagation Practice", "target_skill": "Understanding gradients", "rationale": "Address identified gap", "estimated_duration": 15, "exercises": [{"exercise_number": 1, "type": "explain", "difficulty": 2, "prompt": "Explain backprop", "correct_answer": "Correct explanation", "common_mistakes": ["Mistake 1"], "feedback_if_wrong": "Try again", "feedback_if_correct": "Good!"}], "progression_rule": "3 correct", "mastery_criteria": "80%", "follow_up_plan": {}}'
+_PROJECT_JSON = '{"project_title": "Build a Neural Net", "difficulty_level": "intermediate", "estimated_hours": 4, "skills_practiced": ["Python", "NumPy"], "overview": {"context": "Apply learning", "objective": "Build from scratch"}, "requirements": {}, "phases": [{"phase": 1, "title": "Setup", "estimated_hours": 1, "objectives": ["Install deps"], "tasks": [], "common_pitfalls": [], "checkpoint_validation": "Check setup"}], "resources": {}, "checkpoints": [], "extensions": [], "reflection_questions": [], "next_steps": "Continue learning"}'
+_ANSWER_EVAL_JSON = '{"is_correct": true, "explanation": "Correct answer"}'
+
+
+# Fixtures
+
+
+@pytest.fixture
+def mock_llm_service(stub_llm_service):
+    """Create a stub LLM service."""
+    return stub_llm_service
 
 
 @pytest.fixture
 def agent_context():
     """Create a basic agent context."""
     return AgentContext(
-        user_id=uuid4(),
-        session_id=uuid4(),
+        user_id=next_test_uuid(),
+        session_id=next_test_uuid(),
         conversation_history=[],
         user_profile={"name": "Test User"},
         learning_pattern={},
@@ -59,6 +69,43 @@ def agent_context():
     )
 
 
+@pytest.fixture(scope="module")
+def two_exercise_drill():
+    """A two-exercise drill shared by the lifecycle tests (never mutated)."""
+    return TargetedDrill(
+        id=next_test_uuid(),
+        title="Test Drill",
+        target_skill="Testing",
+        rationale="Test",
+        exercises=[
+            DrillExercise(
+                exercise_number=1,
+                type="flashcard",
+                difficulty=1,
+                prompt="What is 2+2?",
+                correct_answer="4",
+                common_mistakes=["5"],
+                feedback_if_wrong="Try again",
+                feedback_if_correct="Correct!",
+            ),
+            DrillExercise(
+                exercise_number=2,
+                type="flashcard",
+                difficulty=2,
+                prompt="What is 3+3?",
+                correct_answer="6",
+                common_mistakes=["7"],
+                feedback_if_wrong="Try again",
+                feedback_if_correct="Correct!",
+            ),
+        ],
+        progression_rule="2 correct",
+        mastery_criteria="100%",
+        follow_up_plan={},
+        estimated_duration=5,
+    )
+
+
 # Curriculum Agent Tests
 
 
@@ -75,20 +122,17 @@ class TestCurriculumAgent:
         agent = CurriculumAgent(llm_service=mock_llm_service)
         prompt = agent.system_prompt
         assert prompt == "Test system prompt"
-        mock_llm_service.load_prompt_template.assert_called_with("curriculum/learning_path")
+        assert agent.system_prompt is prompt
+        assert mock_llm_service.template_names == ["curriculum/learning_path"]
 
     @pytest.mark.asyncio
     async def test_generate_learning_path(self, mock_llm_service):
         """Test learning path generation."""
         # Mock JSON response
-        mock_llm_service.complete.return_value = LLMResponse(
-            content='{"title": "Test Path", "duration_weeks": 4, "total_hours": 20, "phases": [], "weekly_schedule": [], "success_criteria": []}',
-            model="claude-sonnet-4-20250514",
-            usage={"input_tokens": 100, "output_tokens": 200},
-        )
+        mock_llm_service.next_response = _llm(_CURRICULUM_PATH_JSON)
 
         agent = CurriculumAgent(llm_service=mock_llm_service)
-        user_id = uuid4()
+        user_id = next_test_uuid()
 
         path = await agent.generate_learning_path(
             user_id=user_id,
@@ -103,14 +147,10 @@ class TestCurriculumAgent:
     async def test_recommend_next_topic(self, mock_llm_service):
         """Test topic recommendation."""
         # Mock JSON response
-        mock_llm_service.complete.return_value = LLMResponse(
-            content='{"recommended_topic_id": "123", "topic_title": "Functions", "recommendation_type": "path_continuation", "rationale": "Next step", "activity_type": "read", "estimated_minutes": 30, "difficulty_level": 3, "goal_alignment": "Good fit", "session_structure": []}',
-            model="claude-sonnet-4-20250514",
-            usage={"input_tokens": 100, "output_tokens": 150},
-        )
+        mock_llm_service.next_response = _llm(_RECOMMENDATION_JSON)
 
         agent = CurriculumAgent(llm_service=mock_llm_service)
-        user_id = uuid4()
+        user_id = next_test_uuid()
 
         recommendation = await agent.recommend_next_topic(user_id)
 
@@ -120,11 +160,7 @@ class TestCurriculumAgent:
     @pytest.mark.asyncio
     async def test_respond_path_generation(self, mock_llm_service, agent_context):
         """Test respond method for path generation."""
-        mock_llm_service.complete.return_value = LLMResponse(
-            content='{"title": "AI Learning Path", "duration_weeks": 4, "total_hours": 20, "phases": [{"title": "Phase 1", "milestone": "Basic understanding"}], "weekly_schedule": [], "success_criteria": []}',
-            model="claude-sonnet-4-20250514",
-            usage={"input_tokens": 100, "output_tokens": 200},
-        )
+        mock_llm_service.next_response = _llm(_AI_PATH_JSON)
 
         agent = CurriculumAgent(llm_service=mock_llm_service)
         agent_context.additional_data["action"] = "generate_path"
@@ -138,7 +174,7 @@ class TestCurriculumAgent:
     def test_get_user_path(self, mock_llm_service):
         """Test retrieving user's learning path."""
         agent = CurriculumAgent(llm_service=mock_llm_service)
-        user_id = uuid4()
+        user_id = next_test_uuid()
 
         # No path yet
         path = agent.get_user_path(user_id)
@@ -159,16 +195,12 @@ class TestScoutAgent:
     @pytest.mark.asyncio
     async def test_evaluate_content(self, mock_llm_service):
         """Test content evaluation."""
-        mock_llm_service.complete.return_value = LLMResponse(
-            content='{"relevance_score": 0.8, "timing_assessment": "perfect_timing", "recommended_action": "read_now", "rationale": "Highly relevant", "goal_alignment": {}, "prerequisite_check": {}, "practical_value": {}, "when_to_consume": "immediate", "estimated_time_investment": 15, "key_takeaways": ["Key point"]}',
-            model="claude-sonnet-4-20250514",
-            usage={"input_tokens": 100, "output_tokens": 150},
-        )
+        mock_llm_service.next_response = _llm(_EVALUATION_JSON)
 
         agent = ScoutAgent(llm_service=mock_llm_service)
 
         content = ContentItem(
-            id=uuid4(),
+            id=next_test_uuid(),
             title="Intro to Neural Networks",
             source="Blog",
             content_type="tutorial",
@@ -179,7 +211,7 @@ class TestScoutAgent:
         )
 
         user_profile = UserContentProfile(
-            user_id=uuid4(),
+            user_id=next_test_uuid(),
             goals=["Learn deep learning"],
             current_phase="Foundations",
             current_topics=["neural networks"],
@@ -200,16 +232,12 @@ class TestScoutAgent:
     @pytest.mark.asyncio
     async def test_summarize_content(self, mock_llm_service):
         """Test content summarization."""
-        mock_llm_service.complete.return_value = LLMResponse(
-            content='{"headline": "Key insight here", "core_insight": "Main point explained", "key_concepts": [{"concept": "Backprop", "explanation": "How gradients flow"}], "practical_application": {}, "prerequisites": {}, "technical_details": {}, "connections": {}, "full_summary": "Full summary text", "follow_up_questions": ["Question 1"], "time_saved": 10}',
-            model="claude-sonnet-4-20250514",
-            usage={"input_tokens": 100, "output_tokens": 200},
-        )
+        mock_llm_service.next_response = _llm(_SUMMARY_JSON)
 
         agent = ScoutAgent(llm_service=mock_llm_service)
 
         content = ContentItem(
-            id=uuid4(),
+            id=next_test_uuid(),
             title="Deep Learning Basics",
             source="Article",
             content_type="conceptual",
@@ -231,8 +259,8 @@ class TestScoutAgent:
     def test_reading_list_management(self, mock_llm_service):
         """Test reading list add/remove."""
         agent = ScoutAgent(llm_service=mock_llm_service)
-        user_id = uuid4()
-        content_id = uuid4()
+        user_id = next_test_uuid()
+        content_id = next_test_uuid()
 
         # Add to list
         agent.add_to_reading_list(user_id, content_id)
@@ -257,11 +285,7 @@ class TestDrillSergeantAgent:
     @pytest.mark.asyncio
     async def test_create_targeted_drill(self, mock_llm_service):
         """Test targeted drill creation."""
-        mock_llm_service.complete.return_value = LLMResponse(
-            content='{"drill_title": "Backpropagation Practice", "target_skill": "Understanding gradients", "rationale": "Address identified gap", "estimated_duration": 15, "exercises": [{"exercise_number": 1, "type": "explain", "difficulty": 2, "prompt": "Explain backprop", "correct_answer": "Correct explanation", "common_mistakes": ["Mistake 1"], "feedback_if_wrong": "Try again", "feedback_if_correct": "Good!"}], "progression_rule": "3 correct", "mastery_criteria": "80%", "follow_up_plan": {}}',
-            model="claude-sonnet-4-20250514",
-            usage={"input_tokens": 100, "output_tokens": 200},
-        )
+        mock_llm_service.next_response = _llm(_DRILL_JSON)
 
         agent = DrillSergeantAgent(llm_service=mock_llm_service)
 
@@ -288,11 +312,7 @@ class TestDrillSergeantAgent:
     @pytest.mark.asyncio
     async def test_create_skill_project(self, mock_llm_service):
         """Test skill project creation."""
-        mock_llm_service.complete.return_value = LLMResponse(
-            content='{"project_title": "Build a Neural Net", "difficulty_level": "intermediate", "estimated_hours": 4, "skills_practiced": ["Python", "NumPy"], "overview": {"context": "Apply learning", "objective": "Build from scratch"}, "requirements": {}, "phases": [{"phase": 1, "title": "Setup", "estimated_hours": 1, "objectives": ["Install deps"], "tasks": [], "common_pitfalls": [], "checkpoint_validation": "Check setup"}], "resources": {}, "checkpoints": [], "extensions": [], "reflection_questions": [], "next_steps": "Continue learning"}',
-            model="claude-sonnet-4-20250514",
-            usage={"input_tokens": 100, "output_tokens": 250},
-        )
+        mock_llm_service.next_response = _llm(_PROJECT_JSON)
 
         agent = DrillSergeantAgent(llm_service=mock_llm_service)
 
@@ -313,79 +333,41 @@ class TestDrillSergeantAgent:
         assert project.title == "Build a Neural Net"
         assert len(project.phases) > 0
 
-    def test_drill_lifecycle(self, mock_llm_service):
+    @pytest.mark.parametrize(
+        "next_calls,expected_number",
+        [
+            (0, 1),  # start returns the first exercise
+            (1, 2),  # advancing once returns the second exercise
+            (2, None),  # advancing past the end returns nothing
+        ],
+        ids=["start", "next", "exhaust"],
+    )
+    def test_drill_lifecycle(self, mock_llm_service, two_exercise_drill, next_calls, expected_number):
         """Test starting and progressing through a drill."""
         agent = DrillSergeantAgent(llm_service=mock_llm_service)
-        user_id = uuid4()
+        user_id = next_test_uuid()
+        agent._drills[two_exercise_drill.id] = two_exercise_drill
 
-        # Create a simple drill manually
-        from src.modules.agents.drill_sergeant import TargetedDrill, DrillExercise
+        exercise = agent.start_drill(user_id, two_exercise_drill.id)
+        for _ in range(next_calls):
+            exercise = agent.get_next_exercise(user_id)
 
-        drill = TargetedDrill(
-            id=uuid4(),
-            title="Test Drill",
-            target_skill="Testing",
-            rationale="Test",
-            exercises=[
-                DrillExercise(
-                    exercise_number=1,
-                    type="flashcard",
-                    difficulty=1,
-                    prompt="What is 2+2?",
-                    correct_answer="4",
-                    common_mistakes=["5"],
-                    feedback_if_wrong="Try again",
-                    feedback_if_correct="Correct!",
-                ),
-                DrillExercise(
-                    exercise_number=2,
-                    type="flashcard",
-                    difficulty=2,
-                    prompt="What is 3+3?",
-                    correct_answer="6",
-                    common_mistakes=["7"],
-                    feedback_if_wrong="Try again",
-                    feedback_if_correct="Correct!",
-                ),
-            ],
-            progression_rule="2 correct",
-            mastery_criteria="100%",
-            follow_up_plan={},
-            estimated_duration=5,
-        )
-
-        agent._drills[drill.id] = drill
-
-        # Start drill
-        first_exercise = agent.start_drill(user_id, drill.id)
-        assert first_exercise is not None
-        assert first_exercise.exercise_number == 1
-
-        # Get next exercise
-        next_exercise = agent.get_next_exercise(user_id)
-        assert next_exercise is not None
-        assert next_exercise.exercise_number == 2
-
-        # No more exercises
-        final = agent.get_next_exercise(user_id)
-        assert final is None
+        if expected_number is None:
+            assert exercise is None
+        else:
+            assert exercise is not None
+            assert exercise.exercise_number == expected_number
 
     @pytest.mark.asyncio
     async def test_evaluate_exercise_answer(self, mock_llm_service):
         """Test exercise answer evaluation."""
-        mock_llm_service.complete.return_value = LLMResponse(
-            content='{"is_correct": true, "explanation": "Correct answer"}',
-            model="claude-sonnet-4-20250514",
-            usage={"input_tokens": 50, "output_tokens": 30},
-        )
+        mock_llm_service.next_response = _llm(_ANSWER_EVAL_JSON)
 
         agent = DrillSergeantAgent(llm_service=mock_llm_service)
 
         # Create and store a drill
-        from src.modules.agents.drill_sergeant import TargetedDrill, DrillExercise
-
         drill = TargetedDrill(
-            id=uuid4(),
+            id=next_test_uuid(),
             title="Test",
             target_skill="Test",
             rationale="Test",
@@ -1,8 +1,9 @@
 """Unit tests for NLP command parser."""
 
-import json
+from types import SimpleNamespace
+
+import orjson
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.cli.nlp_parser import (
     CommandIntent,
@@ -17,14 +18,26 @@ from src.shared.exceptions import (
 from src.shared.models import SessionType
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """Create one parser instance shared by the tests in this module.
+
+    Tests that inject an LLM reset it afterwards via ``reset_llm``.
+    """
+    return NLPCommandParser()
+
+
+@pytest.fixture
+def make_llm_response():
+    """Factory for LLM responses whose content is serialized JSON."""
+    def _make(**payload):
+        return SimpleNamespace(content=orjson.dumps(payload).decode())
+    return _make
+
+
 class TestInputSanitization:
     """Tests for input sanitization and security."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance."""
-        return NLPCommandParser()
-
     def test_empty_input_raises_error(self, parser):
         """Test that empty input raises ValidationError."""
         with pytest.raises(ValidationError) as exc_info:
@@ -78,6 +91,7 @@ class TestInputSanitization:
         with pytest.raises(ValidationError) as exc_info:
             parser._sanitize_input(dangerous_input)
         assert "prohibited pattern" in str(exc_info.value).lower()
+        assert pattern_name in str(exc_info.value)
 
     def test_valid_input_passes(self, parser):
         """Test that valid inputs pass sanitization."""
@@ -96,11 +110,6 @@ class TestInputSanitization:
 class TestParameterValidation:
     """Tests for parameter validation methods."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance."""
-        return NLPCommandParser()
-
     def test_validate_minutes_valid(self, parser):
         """Test valid minutes values."""
         assert parser._validate_minutes(30) == 30
@@ -168,11 +177,6 @@ class TestParameterValidation:
 class TestCommandRegistry:
     """Tests for command registry and builders."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance."""
-        return NLPCommandParser()
-
     def test_all_commands_registered(self, parser):
         """Test that all expected commands are in registry."""
         expected_commands = [
@@ -210,11 +214,6 @@ class TestCommandRegistry:
 class TestCommandBuilders:
     """Tests for individual command builders."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance."""
-        return NLPCommandParser()
-
     def test_build_learn_start_default(self, parser):
         """Test building learn.start with defaults."""
         intent = parser._build_learn_start("start a session", {})
@@ -283,23 +282,23 @@ class TestCommandBuilders:
 class TestIntentClassification:
     """Tests for LLM-based intent classification."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance."""
-        return NLPCommandParser()
+    @pytest.fixture(autouse=True)
+    def reset_llm(self, parser):
+        """Drop the LLM and cached intents left on the shared parser."""
+        yield
+        parser._llm = None
+        parser.intent_cache_clear()
 
     @pytest.fixture
-    def mock_llm(self):
-        """Create a mock LLM service."""
-        llm = AsyncMock()
-        return llm
+    def mock_llm(self, stub_llm_service):
+        """Create a lightweight stub LLM service."""
+        return stub_llm_service
 
-    @pytest.mark.asyncio
-    async def test_classify_intent_success(self, parser, mock_llm):
+    async def test_classify_intent_success(self, parser, mock_llm, make_llm_response):
         """Test successful intent classification."""
-        mock_llm.complete = AsyncMock(return_value=MagicMock(
-            content='{"intent": "learn.start", "confidence": 0.95, "params": {"minutes": 30}}'
-        ))
+        mock_llm.next_response = make_llm_response(
+            intent="learn.start", confidence=0.95, params={"minutes": 30},
+        )
         parser._llm = mock_llm
 
         intent, confidence, params = await parser._classify_intent(
@@ -311,23 +310,21 @@ class TestIntentClassification:
         assert confidence == 0.95
         assert params["minutes"] == 30
 
-    @pytest.mark.asyncio
-    async def test_classify_intent_low_confidence_rejected(self, parser, mock_llm):
+    async def test_classify_intent_low_confidence_rejected(self, parser, mock_llm, make_llm_response):
         """Test that low confidence results are rejected."""
-        mock_llm.complete = AsyncMock(return_value=MagicMock(
-            content='{"intent": "learn.start", "confidence": 0.3, "params": {}}'
-        ))
+        mock_llm.next_response = make_llm_response(
+            intent="learn.start", confidence=0.3,
+        )
         parser._llm = mock_llm
 
         with pytest.raises(NLPParseError):
             await parser._classify_intent("maybe start?", is_authenticated=True)
 
-    @pytest.mark.asyncio
     async def test_classify_intent_handles_markdown_blocks(self, parser, mock_llm):
         """Test that markdown code blocks are handled."""
-        mock_llm.complete = AsyncMock(return_value=MagicMock(
+        mock_llm.next_response = SimpleNamespace(
             content='```json\n{"intent": "learn.start", "confidence": 0.9, "params": {}}\n```'
-        ))
+        )
         parser._llm = mock_llm
 
         intent, confidence, params = await parser._classify_intent(
@@ -337,23 +334,19 @@ class TestIntentClassification:
 
         assert intent == "learn.start"
 
-    @pytest.mark.asyncio
     async def test_classify_intent_invalid_json_raises_error(self, parser, mock_llm):
         """Test that invalid JSON raises NLPParseError."""
-        mock_llm.complete = AsyncMock(return_value=MagicMock(
-            content='not valid json'
-        ))
+        mock_llm.next_response = SimpleNamespace(content='not valid json')
         parser._llm = mock_llm
 
         with pytest.raises(NLPParseError):
             await parser._classify_intent("start", is_authenticated=True)
 
-    @pytest.mark.asyncio
-    async def test_classify_intent_clamps_confidence(self, parser, mock_llm):
+    async def test_classify_intent_clamps_confidence(self, parser, mock_llm, make_llm_response):
         """Test that confidence is clamped to 0-1 range."""
-        mock_llm.complete = AsyncMock(return_value=MagicMock(
-            content='{"intent": "learn.start", "confidence": 1.5, "params": {}}'
-        ))
+        mock_llm.next_response = make_llm_response(
+            intent="learn.start", confidence=1.5,
+        )
         parser._llm = mock_llm
 
         intent, confidence, params = await parser._classify_intent(
@@ -363,27 +356,88 @@ class TestIntentClassification:
 
         assert confidence == 1.0
 
+    async def test_classify_intent_uses_static_system_prompt(self, parser, mock_llm, make_llm_response):
+        """Test that the static prompt goes in the prebuilt system prompt."""
+        mock_llm.next_response = make_llm_response(
+            intent="stats.show", confidence=0.95,
+        )
+        parser._llm = mock_llm
+
+        await parser._classify_intent("how am i doing", is_authenticated=False)
+
+        kwargs = mock_llm.calls[-1]
+        assert kwargs["system_prompt"] is parser._system_prompts[False]
+        assert "auth.login" in kwargs["system_prompt"]
+        assert "how am i doing" not in kwargs["system_prompt"]
+        assert "how am i doing" in kwargs["prompt"]
+
+    async def test_classify_intent_caches_exact_match(self, parser, mock_llm, make_llm_response):
+        """Test that a repeated input skips the LLM round-trip."""
+        mock_llm.next_response = make_llm_response(
+            intent="learn.start", confidence=0.95, params={"minutes": 30},
+        )
+        parser._llm = mock_llm
+
+        first = await parser._classify_intent("start a 30 minute session", True)
+        second = await parser._classify_intent("start a 30 minute session", True)
+
+        assert first == second
+        assert len(mock_llm.calls) == 1
+
+        # Authentication state is part of the key
+        await parser._classify_intent("start a 30 minute session", False)
+        assert len(mock_llm.calls) == 2
+
+    async def test_classify_intent_does_not_cache_rejections(self, parser, mock_llm, make_llm_response):
+        """Test that low confidence results are not cached."""
+        mock_llm.next_response = make_llm_response(
+            intent="learn.start", confidence=0.3,
+        )
+        parser._llm = mock_llm
+
+        for _ in range(2):
+            with pytest.raises(NLPParseError):
+                await parser._classify_intent("maybe start?", is_authenticated=True)
+
+        assert len(mock_llm.calls) == 2
+
+    async def test_intent_cache_evicts_least_recent(self, parser, mock_llm, make_llm_response, monkeypatch):
+        """Test that the cache is bounded by INTENT_CACHE_MAX."""
+        monkeypatch.setattr(parser, "INTENT_CACHE_MAX", 2)
+        mock_llm.next_response = make_llm_response(
+            intent="stats.show", confidence=0.9,
+        )
+        parser._llm = mock_llm
+
+        for text in ("stats one", "stats two", "stats one", "stats three"):
+            await parser._classify_intent(text, is_authenticated=True)
+
+        assert list(parser._intent_cache) == [
+            ("stats one", True),
+            ("stats three", True),
+        ]
+
 
 class TestParseCommand:
     """Tests for the main parse_command method."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance."""
-        return NLPCommandParser()
+    @pytest.fixture(autouse=True)
+    def reset_llm(self, parser):
+        """Drop the LLM and cached intents left on the shared parser."""
+        yield
+        parser._llm = None
+        parser.intent_cache_clear()
 
     @pytest.fixture
-    def mock_llm(self):
-        """Create a mock LLM service."""
-        llm = AsyncMock()
-        return llm
+    def mock_llm(self, stub_llm_service):
+        """Create a lightweight stub LLM service."""
+        return stub_llm_service
 
-    @pytest.mark.asyncio
-    async def test_parse_command_success(self, parser, mock_llm):
+    async def test_parse_command_success(self, parser, mock_llm, make_llm_response):
         """Test successful command parsing."""
-        mock_llm.complete = AsyncMock(return_value=MagicMock(
-            content='{"intent": "learn.start", "confidence": 0.95, "params": {"minutes": 30}}'
-        ))
+        mock_llm.next_response = make_llm_response(
+            intent="learn.start", confidence=0.95, params={"minutes": 30},
+        )
         parser._llm = mock_llm
 
         intent = await parser.parse_command(
@@ -395,59 +449,52 @@ class TestParseCommand:
         assert intent.command == "learn.start"
         assert intent.params["minutes"] == 30
 
-    @pytest.mark.asyncio
-    async def test_parse_command_unknown_intent_raises_error(self, parser, mock_llm):
+    async def test_parse_command_unknown_intent_raises_error(self, parser, mock_llm, make_llm_response):
         """Test that unknown intents raise CommandNotFoundError."""
-        mock_llm.complete = AsyncMock(return_value=MagicMock(
-            content='{"intent": "unknown.command", "confidence": 0.9, "params": {}}'
-        ))
+        mock_llm.next_response = make_llm_response(
+            intent="unknown.command", confidence=0.9,
+        )
         parser._llm = mock_llm
 
         with pytest.raises(CommandNotFoundError):
             await parser.parse_command("do something weird", is_authenticated=True)
 
-    @pytest.mark.asyncio
-    async def test_parse_command_needs_confirmation_for_destructive(self, parser, mock_llm):
+    async def test_parse_command_needs_confirmation_for_destructive(self, parser, mock_llm, make_llm_response):
         """Test that destructive commands need confirmation."""
-        mock_llm.complete = AsyncMock(return_value=MagicMock(
-            content='{"intent": "auth.logout", "confidence": 0.99, "params": {}}'
-        ))
+        mock_llm.next_response = make_llm_response(
+            intent="auth.logout", confidence=0.99,
+        )
         parser._llm = mock_llm
 
         intent = await parser.parse_command("log me out", is_authenticated=True)
 
         assert intent.needs_confirmation is True
 
-    @pytest.mark.asyncio
-    async def test_parse_command_needs_confirmation_for_low_confidence(self, parser, mock_llm):
+    async def test_parse_command_needs_confirmation_for_low_confidence(self, parser, mock_llm, make_llm_response):
         """Test that low confidence commands need confirmation."""
-        mock_llm.complete = AsyncMock(return_value=MagicMock(
-            content='{"intent": "learn.start", "confidence": 0.6, "params": {}}'
-        ))
+        mock_llm.next_response = make_llm_response(
+            intent="learn.start", confidence=0.6,
+        )
         parser._llm = mock_llm
 
         intent = await parser.parse_command("maybe start", is_authenticated=True)
 
         assert intent.needs_confirmation is True
 
-    @pytest.mark.asyncio
     async def test_parse_command_sanitizes_input(self, parser, mock_llm):
         """Test that input is sanitized before classification."""
+        parser._llm = mock_llm
+
         with pytest.raises(ValidationError):
             await parser.parse_command("start; rm -rf /", is_authenticated=True)
 
         # LLM should not have been called
-        mock_llm.complete.assert_not_called()
+        assert mock_llm.calls == []
 
 
 class TestAvailableCommands:
     """Tests for available commands list."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance."""
-        return NLPCommandParser()
-
     def test_authenticated_includes_auth_commands(self, parser):
         """Test that authenticated users see auth commands."""
         commands = parser._get_available_commands(is_authenticated=True)
@@ -471,11 +518,6 @@ class TestAvailableCommands:
 class TestHelperMethods:
     """Tests for helper methods."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance."""
-        return NLPCommandParser()
-
     def test_get_suggestion_includes_examples(self, parser):
         """Test that get_suggestion includes helpful examples."""
         suggestion = parser.get_suggestion("bad input")
@@ -489,9 +531,15 @@ class TestSingleton:
     def test_get_nlp_parser_returns_same_instance(self):
         """Test that get_nlp_parser returns the same instance."""
         # Reset singleton
-        import src.cli.nlp_parser as module
-        module._parser = None
+        get_nlp_parser.cache_clear()
 
         parser1 = get_nlp_parser()
         parser2 = get_nlp_parser()
         assert parser1 is parser2
+
+    def test_cache_clear_creates_new_instance(self):
+        """Test that clearing the cache yields a fresh parser."""
+        parser1 = get_nlp_parser()
+        get_nlp_parser.cache_clear()
+        parser2 = get_nlp_parser()
+        assert parser1 is not parser2
@@ -1,7 +1,9 @@
 """Unit tests for enhanced question types."""
 
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.modules.assessment.question_types import (
     QuestionDifficulty,
@@ -13,6 +15,7 @@ from src.modules.assessment.question_types import (
     ComparisonQuestionGenerator,
     ApplicationQuestionGenerator,
     QuestionGeneratorFactory,
+    MAX_CONCURRENT_GENERATIONS,
     generate_mixed_questions,
 )
 
@@ -22,13 +25,10 @@ class TestQuestionDifficulty:
 
     def test_difficulty_levels(self):
         """Test all difficulty levels exist."""
-        levels = [d.value for d in QuestionDifficulty]
-        assert "recall" in levels
-        assert "understand" in levels
-        assert "apply" in levels
-        assert "analyze" in levels
-        assert "evaluate" in levels
-        assert "create" in levels
+        levels = {d.value for d in QuestionDifficulty}
+        assert {
+            "recall", "understand", "apply", "analyze", "evaluate", "create",
+        } <= levels
 
 
 class TestQuestionType:
@@ -36,11 +36,8 @@ class TestQuestionType:
 
     def test_question_types(self):
         """Test all question types exist."""
-        types = [t.value for t in QuestionType]
-        assert "scenario" in types
-        assert "comparison" in types
-        assert "application" in types
-        assert "multiple_choice" in types
+        types = {t.value for t in QuestionType}
+        assert {"scenario", "comparison", "application", "multiple_choice"} <= types
 
 
 class TestGeneratedQuestion:
@@ -91,7 +88,6 @@ class TestScenarioQuestionGenerator:
         """Test question type is SCENARIO."""
         assert generator.question_type == QuestionType.SCENARIO
 
-    @pytest.mark.asyncio
     async def test_generate_without_llm(self, generator):
         """Test generation falls back to templates."""
         question = await generator.generate(
@@ -104,7 +100,25 @@ class TestScenarioQuestionGenerator:
         assert len(question.options) > 0
         assert question.correct_answer is not None
 
-    @pytest.mark.asyncio
+    async def test_template_questions_are_independent_copies(self, generator):
+        """Test template questions don't share mutable state."""
+        first = await generator.generate(
+            topic="Neural Networks",
+            difficulty=QuestionDifficulty.APPLY,
+        )
+        second = await generator.generate(
+            topic="neural-networks",
+            difficulty=QuestionDifficulty.EVALUATE,
+        )
+
+        first.options.clear()
+        first.hints.append("extra")
+
+        assert first.topic == "Neural Networks"
+        assert second.difficulty == QuestionDifficulty.EVALUATE
+        assert len(second.options) == 4
+        assert "extra" not in second.hints
+
     async def test_generate_generic_for_unknown_topic(self, generator):
         """Test generic scenario for unknown topic."""
         question = await generator.generate(
@@ -116,7 +130,6 @@ class TestScenarioQuestionGenerator:
         assert question.topic == "unknown_topic_xyz"
         assert len(question.options) >= 2
 
-    @pytest.mark.asyncio
     async def test_generate_with_llm(self, generator_with_llm):
         """Test generation uses LLM when available."""
         import json
@@ -155,7 +168,6 @@ class TestComparisonQuestionGenerator:
         """Test question type is COMPARISON."""
         assert generator.question_type == QuestionType.COMPARISON
 
-    @pytest.mark.asyncio
     async def test_generate_for_known_topic(self, generator):
         """Test generation for topic with templates."""
         question = await generator.generate(
@@ -166,7 +178,6 @@ class TestComparisonQuestionGenerator:
         assert question.question_type == QuestionType.COMPARISON
         assert "concept_a" in question.metadata or question.metadata == {}
 
-    @pytest.mark.asyncio
     async def test_generate_for_unknown_topic(self, generator):
         """Test generic comparison for unknown topic."""
         question = await generator.generate(
@@ -190,7 +201,6 @@ class TestApplicationQuestionGenerator:
         """Test question type is APPLICATION."""
         assert generator.question_type == QuestionType.APPLICATION
 
-    @pytest.mark.asyncio
     async def test_generate_for_known_topic(self, generator):
         """Test generation for topic with templates."""
         question = await generator.generate(
@@ -201,7 +211,6 @@ class TestApplicationQuestionGenerator:
         assert question.question_type == QuestionType.APPLICATION
         assert len(question.options) >= 2
 
-    @pytest.mark.asyncio
     async def test_generate_generic(self, generator):
         """Test generic application question."""
         question = await generator.generate(
@@ -240,6 +249,15 @@ class TestQuestionGeneratorFactory:
         )
         assert generator._llm is mock_llm
 
+    def test_create_reuses_generator_per_llm(self):
+        """Test that generators are cached per LLM service."""
+        mock_llm = MagicMock()
+        generator = QuestionGeneratorFactory.create(QuestionType.SCENARIO, mock_llm)
+
+        assert QuestionGeneratorFactory.create(QuestionType.SCENARIO, mock_llm) is generator
+        assert QuestionGeneratorFactory.create(QuestionType.COMPARISON, mock_llm) is not generator
+        assert QuestionGeneratorFactory.create(QuestionType.SCENARIO, MagicMock()) is not generator
+
     def test_unsupported_type_raises_error(self):
         """Test that unsupported types raise ValueError."""
         with pytest.raises(ValueError, match="Unsupported"):
@@ -256,7 +274,6 @@ class TestQuestionGeneratorFactory:
 class TestGenerateMixedQuestions:
     """Tests for generate_mixed_questions function."""
 
-    @pytest.mark.asyncio
     async def test_generates_correct_count(self):
         """Test generating specified number of questions."""
         questions = await generate_mixed_questions(
@@ -267,7 +284,6 @@ class TestGenerateMixedQuestions:
 
         assert len(questions) == 5
 
-    @pytest.mark.asyncio
     async def test_generates_mixed_types(self):
         """Test that questions have different types."""
         questions = await generate_mixed_questions(
@@ -279,7 +295,6 @@ class TestGenerateMixedQuestions:
         types = {q.question_type for q in questions}
         assert len(types) >= 2  # At least 2 different types
 
-    @pytest.mark.asyncio
     async def test_with_llm_service(self):
         """Test generation with LLM service (falls back to templates on error)."""
         # The generators use LLM for dynamic content but fall back on failure
@@ -292,3 +307,37 @@ class TestGenerateMixedQuestions:
         )
 
         assert len(questions) == 3
+
+    async def test_bounds_concurrent_generations(self):
+        """Test no more than MAX_CONCURRENT_GENERATIONS run at once."""
+        in_flight = 0
+        peak = 0
+        original = ScenarioQuestionGenerator.generate
+
+        async def tracked_generate(self, topic, difficulty):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return await original(self, topic, difficulty)
+
+        with patch.object(
+            QuestionGeneratorFactory,
+            "get_supported_types",
+            return_value=[QuestionType.SCENARIO],
+        ), patch.object(ScenarioQuestionGenerator, "generate", tracked_generate):
+            questions = await generate_mixed_questions(topic="testing", count=10)
+
+        assert len(questions) == 10
+        assert peak == MAX_CONCURRENT_GENERATIONS
+
+    async def test_cancellation_is_not_swallowed(self):
+        """Test a cancelled generation propagates instead of being returned."""
+        with patch.object(
+            ScenarioQuestionGenerator,
+            "generate",
+            AsyncMock(side_effect=asyncio.CancelledError),
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await generate_mixed_questions(topic="testing", count=4)
@@ -1,31 +1,71 @@
 """Unit tests for background job scheduler."""
 
+from contextlib import contextmanager
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
 from datetime import datetime, timezone
+from types import SimpleNamespace
 
 from src.jobs.scheduler import JobScheduler, get_scheduler, reset_scheduler
-from src.shared.feature_flags import FeatureFlags
+from src.shared.feature_flags import FeatureFlagManager, FeatureFlags
+
+# Autospec introspects the class, so the flag manager mock is built once
+_FLAGS = create_autospec(FeatureFlagManager, instance=True)
+
+# Fixed timestamp so job listings are deterministic
+_NEXT_RUN = datetime(2024, 1, 1, 6, 0, tzinfo=timezone.utc)
+
+
+@contextmanager
+def _swap(obj, name, value):
+    """Temporarily replace an attribute; a lighter-weight patch.object."""
+    had_own = name in vars(obj)
+    original = getattr(obj, name)
+    setattr(obj, name, value)
+    try:
+        yield value
+    finally:
+        if had_own:
+            setattr(obj, name, original)
+        else:
+            delattr(obj, name)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patch_feature_flags():
+    """Route the scheduler's feature flag lookups to the shared mock."""
+    with patch("src.jobs.scheduler.get_feature_flags", return_value=_FLAGS):
+        yield
+
+
+@pytest.fixture(scope="module")
+def clean_scheduler():
+    """Start the module without a scheduler left over from other tests."""
+    reset_scheduler()
 
 
 class TestJobScheduler:
     """Tests for JobScheduler class."""
 
+    # add_job only reads the id, so plain stubs are shared across tests
+    _JOBS = {
+        "test-job": SimpleNamespace(id="test-job"),
+        "cron-job": SimpleNamespace(id="cron-job"),
+    }
+
     @pytest.fixture(autouse=True)
-    def reset_singleton(self):
-        """Reset scheduler singleton before each test."""
-        reset_scheduler()
+    def reset_singleton(self, clean_scheduler):
+        """Reset scheduler singleton after each test."""
         yield
         reset_scheduler()
 
     @pytest.fixture
     def mock_feature_flags(self):
         """Mock feature flags to enable background jobs."""
-        with patch("src.jobs.scheduler.get_feature_flags") as mock:
-            flags = MagicMock()
-            flags.is_enabled.return_value = True
-            mock.return_value = flags
-            yield flags
+        _FLAGS.reset_mock(return_value=True, side_effect=True)
+        _FLAGS.is_enabled.return_value = True
+        return _FLAGS
 
     def test_scheduler_initialization(self, mock_feature_flags):
         """Test scheduler initializes correctly."""
@@ -43,31 +83,28 @@ class TestJobScheduler:
         """Test scheduler starts when feature flag is enabled."""
         scheduler = JobScheduler()
 
-        with patch.object(scheduler.scheduler, "start") as mock_start:
+        with _swap(scheduler.scheduler, "start", MagicMock()) as mock_start:
             scheduler.start()
             mock_start.assert_called_once()
             assert scheduler.is_running
 
-    def test_start_with_feature_disabled(self):
+    def test_start_with_feature_disabled(self, mock_feature_flags):
         """Test scheduler does not start when feature flag is disabled."""
-        with patch("src.jobs.scheduler.get_feature_flags") as mock:
-            flags = MagicMock()
-            flags.is_enabled.return_value = False
-            mock.return_value = flags
+        mock_feature_flags.is_enabled.return_value = False
 
-            scheduler = JobScheduler()
-            scheduler.start()
+        scheduler = JobScheduler()
+        scheduler.start()
 
-            assert not scheduler.is_running
+        assert not scheduler.is_running
 
     def test_shutdown(self, mock_feature_flags):
         """Test scheduler shutdown."""
         scheduler = JobScheduler()
 
-        with patch.object(scheduler.scheduler, "start"):
+        with _swap(scheduler.scheduler, "start", MagicMock()):
             scheduler.start()
 
-        with patch.object(scheduler.scheduler, "shutdown") as mock_shutdown:
+        with _swap(scheduler.scheduler, "shutdown", MagicMock()) as mock_shutdown:
             scheduler.shutdown()
             mock_shutdown.assert_called_once_with(wait=True)
             assert not scheduler.is_running
@@ -79,8 +116,9 @@ class TestJobScheduler:
         async def test_task():
             pass
 
-        with patch.object(scheduler.scheduler, "add_job") as mock_add:
-            mock_add.return_value = MagicMock(id="test-job")
+        with _swap(
+            scheduler.scheduler, "add_job", MagicMock(return_value=self._JOBS["test-job"])
+        ) as mock_add:
             job_id = scheduler.add_job(test_task, hours=6, job_id="test-job")
 
             assert job_id == "test-job"
@@ -93,11 +131,13 @@ class TestJobScheduler:
         async def test_task():
             pass
 
-        with patch.object(scheduler.scheduler, "add_job") as mock_add:
-            mock_add.return_value = MagicMock(id="cron-job")
+        with _swap(
+            scheduler.scheduler, "add_job", MagicMock(return_value=self._JOBS["cron-job"])
+        ) as mock_add:
             job_id = scheduler.add_job(test_task, cron="0 6 * * *", job_id="cron-job")
 
             assert job_id == "cron-job"
+            mock_add.assert_called_once()
 
     def test_add_job_requires_schedule(self, mock_feature_flags):
         """Test that add_job raises error without schedule."""
@@ -113,7 +153,7 @@ class TestJobScheduler:
         """Test removing a job."""
         scheduler = JobScheduler()
 
-        with patch.object(scheduler.scheduler, "remove_job") as mock_remove:
+        with _swap(scheduler.scheduler, "remove_job", MagicMock()) as mock_remove:
             result = scheduler.remove_job("test-job")
             assert result is True
             mock_remove.assert_called_once_with("test-job")
@@ -122,7 +162,7 @@ class TestJobScheduler:
         """Test removing a job that doesn't exist."""
         scheduler = JobScheduler()
 
-        with patch.object(scheduler.scheduler, "remove_job") as mock_remove:
+        with _swap(scheduler.scheduler, "remove_job", MagicMock()) as mock_remove:
             mock_remove.side_effect = Exception("Job not found")
             result = scheduler.remove_job("nonexistent")
             assert result is False
@@ -131,22 +171,25 @@ class TestJobScheduler:
         """Test getting job list."""
         scheduler = JobScheduler()
 
-        mock_job = MagicMock()
-        mock_job.id = "test-job"
-        mock_job.name = "test"
-        mock_job.next_run_time = datetime.now(timezone.utc)
-        mock_job.trigger = MagicMock(__str__=lambda s: "interval[6 hours]")
+        job = SimpleNamespace(
+            id="test-job",
+            name="test",
+            next_run_time=_NEXT_RUN,
+            trigger="interval[6 hours]",
+        )
 
-        with patch.object(scheduler.scheduler, "get_jobs", return_value=[mock_job]):
+        with _swap(scheduler.scheduler, "get_jobs", MagicMock(return_value=[job])):
             jobs = scheduler.get_jobs()
             assert len(jobs) == 1
             assert jobs[0]["id"] == "test-job"
+            assert jobs[0]["next_run"] == "2024-01-01T06:00:00+00:00"
+            assert jobs[0]["trigger"] == "interval[6 hours]"
 
     def test_schedule_content_ingestion(self, mock_feature_flags):
         """Test scheduling content ingestion job."""
         scheduler = JobScheduler()
 
-        with patch.object(scheduler, "add_job") as mock_add:
+        with _swap(scheduler, "add_job", MagicMock()) as mock_add:
             mock_add.return_value = "content-ingestion"
             job_id = scheduler.schedule_content_ingestion(interval_hours=6)
 
@@ -157,7 +200,7 @@ class TestJobScheduler:
         """Test scheduling token cleanup job."""
         scheduler = JobScheduler()
 
-        with patch.object(scheduler, "add_job") as mock_add:
+        with _swap(scheduler, "add_job", MagicMock()) as mock_add:
             mock_add.return_value = "token-cleanup"
             job_id = scheduler.schedule_token_cleanup(interval_hours=24)
 
@@ -167,7 +210,7 @@ class TestJobScheduler:
         """Test scheduling all default jobs."""
         scheduler = JobScheduler()
 
-        with patch.object(scheduler, "add_job") as mock_add:
+        with _swap(scheduler, "add_job", MagicMock()) as mock_add:
             mock_add.return_value = "job"
             job_ids = scheduler.schedule_all_default_jobs()
 
@@ -175,31 +218,49 @@ class TestJobScheduler:
             assert mock_add.call_count == 4
 
 
+class _Result:
+    """Minimal stand-in for the buffered result of AsyncSession.execute()."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return list(self.rows)
+
+
+@pytest.fixture(scope="class")
+def shared_db_session():
+    """Patch the database session context manager once per test class."""
+    with patch("src.jobs.tasks.get_db_session") as mock:
+        session = AsyncMock()
+        mock.return_value.__aenter__.return_value = session
+        mock.return_value.__aexit__.return_value = None
+        yield session
+
+
 class TestScheduledTasks:
     """Tests for scheduled task functions."""
 
     @pytest.fixture
-    def mock_db_session(self):
-        """Mock database session context manager."""
-        with patch("src.jobs.tasks.get_db_session") as mock:
-            session = AsyncMock()
-            mock.return_value.__aenter__.return_value = session
-            mock.return_value.__aexit__.return_value = None
-            yield session
+    def mock_db_session(self, shared_db_session):
+        """Shared session mock with calls and configured results reset."""
+        shared_db_session.reset_mock(return_value=True, side_effect=True)
+        return shared_db_session
 
     @pytest.mark.asyncio
-    async def test_run_token_cleanup(self, mock_db_session):
+    @pytest.mark.parametrize("rows,expected", [
+        ([{"id": 1}, {"id": 2}, {"id": 3}], 3),
+        ([], 0),
+    ], ids=["expired", "none-expired"])
+    async def test_run_token_cleanup(self, mock_db_session, rows, expected):
         """Test token cleanup task."""
         from src.jobs.tasks import run_token_cleanup
 
-        # Mock the execute result
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [{"id": 1}, {"id": 2}, {"id": 3}]
-        mock_db_session.execute.return_value = mock_result
+        mock_db_session.execute.return_value = _Result(rows)
 
         result = await run_token_cleanup()
 
-        assert result["tokens_removed"] == 3
+        assert result["tokens_removed"] == expected
         assert "completed_at" in result
         assert not result["errors"]
 
@@ -221,13 +282,10 @@ class TestScheduledTasks:
         """Test review notifications task."""
         from src.jobs.tasks import run_review_notifications
 
-        # Mock the execute result
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [
+        mock_db_session.execute.return_value = _Result([
             {"user_id": "user1", "email": "a@b.com", "items_due": 5},
             {"user_id": "user2", "email": "c@d.com", "items_due": 3},
-        ]
-        mock_db_session.execute.return_value = mock_result
+        ])
 
         result = await run_review_notifications()
 
@@ -1,10 +1,12 @@
 """Unit tests for service registry."""
 
+import importlib
 import os
 from unittest.mock import patch, MagicMock
 
 import pytest
 
+from src.modules.session import SessionService
 from src.shared.feature_flags import FeatureFlagManager, FeatureFlags
 from src.shared.service_registry import (
     ServiceRegistry,
@@ -15,51 +17,82 @@ from src.shared.service_registry import (
     get_adaptation_service,
 )
 
+SERVICE_MODULES = [
+    ("src.modules.session", "get_session_service"),
+    ("src.modules.content", "get_content_service"),
+    ("src.modules.assessment", "get_assessment_service"),
+    ("src.modules.adaptation", "get_adaptation_service"),
+]
 
+
+@pytest.fixture(scope="module")
+def shared_registry():
+    """Create the registry singleton once for this module."""
+    ServiceRegistry._instance = None
+    FeatureFlagManager._instance = None
+    registry = ServiceRegistry()
+    yield registry
+    ServiceRegistry._instance = None
+    FeatureFlagManager._instance = None
+
+
+@pytest.fixture(scope="class")
+def inmemory_env():
+    """Disable database persistence once for a whole test class.
+
+    Tests that need the flag on patch it themselves.
+    """
+    with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
+        yield
+
+
+@pytest.fixture
+def reset_singletons(shared_registry):
+    """Reset cached services and the registry getter before each test."""
+    shared_registry.clear_cache()
+    get_service_registry.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def warm_service_modules():
+    """Import the module packages once so per-test imports hit sys.modules."""
+    for module, _ in SERVICE_MODULES:
+        importlib.import_module(module)
+
+
+@pytest.mark.usefixtures("inmemory_env")
 class TestServiceRegistry:
     """Tests for ServiceRegistry."""
 
     @pytest.fixture
-    def registry(self):
-        """Create a fresh registry for each test."""
-        # Clear singletons
-        ServiceRegistry._instance = None
-        FeatureFlagManager._instance = None
-        registry = ServiceRegistry()
-        registry.clear_cache()
-        return registry
+    def registry(self, shared_registry):
+        """Reset the shared registry's flag overrides and cached services."""
+        shared_registry._flags.clear_all_overrides()
+        shared_registry.clear_cache()
+        return shared_registry
 
-    @pytest.fixture(autouse=True)
-    def reset_env(self):
-        """Reset environment variables."""
-        with patch.dict(os.environ, {}, clear=True):
-            yield
-
-    def test_singleton_pattern(self):
+    def test_singleton_pattern(self, shared_registry):
         """Test that ServiceRegistry is a singleton."""
-        ServiceRegistry._instance = None
         registry1 = ServiceRegistry()
         registry2 = ServiceRegistry()
         assert registry1 is registry2
-
-    def test_get_session_service_inmemory_default(self, registry):
-        """Test that in-memory session service is returned by default."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            FeatureFlagManager._instance = None
-            registry._flags = FeatureFlagManager()
-            registry.clear_cache()
-
-            service = registry.get_session_service()
-            assert service is not None
-            assert "SessionService" in type(service).__name__
+        assert registry1 is shared_registry
+
+    @pytest.mark.parametrize("getter,expected", [
+        ("get_session_service", "SessionService"),
+        ("get_content_service", "ContentService"),
+        ("get_assessment_service", "AssessmentService"),
+        ("get_adaptation_service", "AdaptationService"),
+    ])
+    def test_get_service_inmemory_default(self, registry, getter, expected):
+        """Test that in-memory services are returned by default."""
+        service = getattr(registry, getter)()
+        assert service is not None
+        assert type(service).__name__ == expected
 
     def test_get_session_service_database_when_enabled(self, registry):
         """Test that database session service is returned when flag enabled."""
         with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "true"}):
-            FeatureFlagManager._instance = None
-            registry._flags = FeatureFlagManager()
-            registry.clear_cache()
-
             # Mock the database service to avoid actual DB connection
             with patch("src.modules.session.db_service.DatabaseSessionService") as mock_db:
                 mock_instance = MagicMock()
@@ -72,87 +105,35 @@ class TestServiceRegistry:
                 # Should attempt to create database service
                 mock_db.assert_called_once()
 
-    def test_get_content_service_inmemory_default(self, registry):
-        """Test that in-memory content service is returned by default."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            FeatureFlagManager._instance = None
-            registry._flags = FeatureFlagManager()
-            registry.clear_cache()
-
-            service = registry.get_content_service()
-            assert service is not None
-            assert "ContentService" in type(service).__name__
-
-    def test_get_assessment_service_inmemory_default(self, registry):
-        """Test that in-memory assessment service is returned by default."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            FeatureFlagManager._instance = None
-            registry._flags = FeatureFlagManager()
-            registry.clear_cache()
-
-            service = registry.get_assessment_service()
-            assert service is not None
-            assert "AssessmentService" in type(service).__name__
-
-    def test_get_adaptation_service_inmemory_default(self, registry):
-        """Test that in-memory adaptation service is returned by default."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            FeatureFlagManager._instance = None
-            registry._flags = FeatureFlagManager()
-            registry.clear_cache()
-
-            service = registry.get_adaptation_service()
-            assert service is not None
-            assert "AdaptationService" in type(service).__name__
-
     def test_service_caching(self, registry):
         """Test that services are cached after first creation."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            FeatureFlagManager._instance = None
-            registry._flags = FeatureFlagManager()
-            registry.clear_cache()
-
-            service1 = registry.get_session_service()
-            service2 = registry.get_session_service()
-            assert service1 is service2
+        service1 = registry.get_session_service()
+        service2 = registry.get_session_service()
+        assert service1 is service2
 
     def test_clear_cache(self, registry):
         """Test that clear_cache removes cached services."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            FeatureFlagManager._instance = None
-            registry._flags = FeatureFlagManager()
-            registry.clear_cache()
-
-            service1 = registry.get_session_service()
-            registry.clear_cache()
-            service2 = registry.get_session_service()
-            # After cache clear, should get new instance
-            # (Note: for in-memory services, these may still be same singleton)
-            assert registry._session_service is not None
+        service1 = registry.get_session_service()
+        registry.clear_cache()
+        service2 = registry.get_session_service()
+        # After cache clear, should get new instance
+        # (Note: for in-memory services, these may still be same singleton)
+        assert registry._session_service is not None
 
     def test_get_service_info(self, registry):
         """Test getting service info."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            FeatureFlagManager._instance = None
-            registry._flags = FeatureFlagManager()
-            registry.clear_cache()
+        # Initially empty
+        assert registry.get_service_info() == {}
 
-            # Initially empty
-            assert registry.get_service_info() == {}
-
-            # After getting services
-            registry.get_session_service()
-            info = registry.get_service_info()
-            assert "session" in info
-            assert "SessionService" in info["session"]
+        # After getting services
+        registry.get_session_service()
+        info = registry.get_service_info()
+        assert "session" in info
+        assert info["session"] == "SessionService"
 
     def test_fallback_on_db_error(self, registry):
         """Test fallback to in-memory when DB service creation fails."""
         with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "true"}):
-            FeatureFlagManager._instance = None
-            registry._flags = FeatureFlagManager()
-            registry.clear_cache()
-
             # Mock database service to raise an error
             with patch(
                 "src.modules.session.db_service.DatabaseSessionService",
@@ -160,95 +141,40 @@ class TestServiceRegistry:
             ):
                 service = registry.get_session_service()
                 # Should fallback to in-memory
-                assert "SessionService" in type(service).__name__
-                assert "Database" not in type(service).__name__
+                assert type(service) is SessionService
 
     def test_repr(self, registry):
         """Test string representation."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            FeatureFlagManager._instance = None
-            registry._flags = FeatureFlagManager()
-            registry.clear_cache()
-
-            repr_str = repr(registry)
-            assert "ServiceRegistry" in repr_str
-            assert "db_enabled=False" in repr_str
+        repr_str = repr(registry)
+        assert "ServiceRegistry" in repr_str
+        assert "db_enabled=False" in repr_str
 
 
+@pytest.mark.usefixtures("inmemory_env", "reset_singletons")
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
 
-    @pytest.fixture(autouse=True)
-    def reset_singletons(self):
-        """Reset singletons before each test."""
-        ServiceRegistry._instance = None
-        FeatureFlagManager._instance = None
-        get_service_registry.cache_clear()
-        yield
-
-    def test_get_session_service_convenience(self):
-        """Test get_session_service convenience function."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            service = get_session_service()
-            assert service is not None
-
-    def test_get_content_service_convenience(self):
-        """Test get_content_service convenience function."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            service = get_content_service()
-            assert service is not None
-
-    def test_get_assessment_service_convenience(self):
-        """Test get_assessment_service convenience function."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            service = get_assessment_service()
-            assert service is not None
-
-    def test_get_adaptation_service_convenience(self):
-        """Test get_adaptation_service convenience function."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            service = get_adaptation_service()
-            assert service is not None
+    @pytest.mark.parametrize("getter", [
+        get_session_service,
+        get_content_service,
+        get_assessment_service,
+        get_adaptation_service,
+    ])
+    def test_get_service_convenience(self, getter):
+        """Test the service convenience functions."""
+        service = getter()
+        assert service is not None
 
 
+@pytest.mark.usefixtures("inmemory_env", "warm_service_modules", "reset_singletons")
 class TestModuleImports:
     """Tests for module-level imports using registry."""
 
-    @pytest.fixture(autouse=True)
-    def reset_singletons(self):
-        """Reset singletons before each test."""
-        ServiceRegistry._instance = None
-        FeatureFlagManager._instance = None
-        get_service_registry.cache_clear()
-        yield
-
-    def test_session_module_import(self):
-        """Test importing get_session_service from session module."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            from src.modules.session import get_session_service as session_get
-            service = session_get()
-            assert service is not None
-
-    def test_content_module_import(self):
-        """Test importing get_content_service from content module."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            from src.modules.content import get_content_service as content_get
-            service = content_get()
-            assert service is not None
-
-    def test_assessment_module_import(self):
-        """Test importing get_assessment_service from assessment module."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            from src.modules.assessment import get_assessment_service as assessment_get
-            service = assessment_get()
-            assert service is not None
-
-    def test_adaptation_module_import(self):
-        """Test importing get_adaptation_service from adaptation module."""
-        with patch.dict(os.environ, {"FF_USE_DATABASE_PERSISTENCE": "false"}):
-            from src.modules.adaptation import get_adaptation_service as adaptation_get
-            service = adaptation_get()
-            assert service is not None
+    @pytest.mark.parametrize("module,getter", SERVICE_MODULES)
+    def test_module_import(self, module, getter):
+        """Test importing the service getter from each module package."""
+        service = getattr(importlib.import_module(module), getter)()
+        assert service is not None
 
     def test_direct_inmemory_access(self):
         """Test direct in-memory service access bypasses registry."""
@@ -256,5 +182,4 @@ class TestModuleImports:
             from src.modules.session import get_inmemory_session_service
             service = get_inmemory_session_service()
             # Should be in-memory even though flag says DB
-            assert "SessionService" in type(service).__name__
-            assert "Database" not in type(service).__name__
+            assert type(service) is SessionService
@@ -1,10 +1,14 @@
 """Tests for Session module - service and planning."""
 
+import asyncio
+from typing import Any
+
 import pytest
 from datetime import datetime, date, timedelta
-from unittest.mock import AsyncMock, MagicMock
-from uuid import UUID, uuid4
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import UUID
 
+from src.modules.llm.service import LLMResponse, LLMService
 from src.modules.session.interface import (
     Session,
     SessionActivity,
@@ -14,62 +18,81 @@ from src.modules.session.interface import (
 )
 from src.modules.session.service import SessionService
 from src.shared.models import ActivityType, SessionStatus, SessionType
+from tests.conftest import MISSING_TEST_UUID, next_test_uuid
+
+_LLM_RESPONSE = LLMResponse(
+    content="Test response",
+    model="claude-sonnet-4-20250514",
+    usage={"input_tokens": 10, "output_tokens": 20},
+)
+
+# complete_activity() copies these into the activity with .update(), so
+# they can be shared across tests
+_QUIZ_PERF = {"score": 0.85}
+_FEYNMAN_PERF = {"score": 0.9, "gaps": ["concept A"]}
+_GAPS_PERF = {"gaps": ["concept X", "concept Y"]}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def sequential_service_ids():
+    """Draw the service's session and activity ids from the test id counter."""
+    with patch("src.modules.session.service.uuid4", next_test_uuid):
+        yield
+
+
+@pytest.fixture(scope="module")
+def mock_llm() -> Mock:
+    """Create mock LLM service, shared across the module.
+
+    SessionService holds all session state itself, so the mock carries
+    nothing between tests beyond call records, which service() resets.
+    """
+    llm = Mock(spec_set=LLMService)
+    llm.complete = AsyncMock(return_value=_LLM_RESPONSE)
+    return llm
 
 
 class TestSessionService:
     """Tests for SessionService."""
 
     @pytest.fixture
-    def mock_llm(self) -> MagicMock:
-        """Create mock LLM service."""
-        llm = MagicMock()
-        llm.complete = AsyncMock(return_value=MagicMock(content="Test response"))
-        return llm
-
-    @pytest.fixture
-    def service(self, mock_llm: MagicMock) -> SessionService:
+    def service(self, mock_llm: Mock) -> SessionService:
         """Create SessionService with mocked dependencies."""
+        mock_llm.reset_mock()
         return SessionService(llm_service=mock_llm)
 
     @pytest.fixture
     def user_id(self) -> UUID:
         """Create a test user ID."""
-        return uuid4()
+        return next_test_uuid()
 
     # --- Session Lifecycle Tests ---
 
+    @pytest.mark.parametrize("session_type,minutes", [
+        (SessionType.REGULAR, 30),
+        (SessionType.CATCHUP, 45),
+        (SessionType.DRILL, 20),
+    ], ids=["regular", "catchup", "drill"])
     @pytest.mark.asyncio
-    async def test_start_session(self, service: SessionService, user_id: UUID):
-        """Test starting a new session."""
-        session = await service.start_session(user_id, available_minutes=30)
-
-        assert session.id is not None
-        assert session.user_id == user_id
-        assert session.status == SessionStatus.IN_PROGRESS
-        assert session.planned_duration_minutes == 30
-        assert session.session_type == SessionType.REGULAR
-
-    @pytest.mark.asyncio
-    async def test_start_session_catchup(self, service: SessionService, user_id: UUID):
-        """Test starting a catchup session."""
-        session = await service.start_session(
-            user_id,
-            available_minutes=45,
-            session_type=SessionType.CATCHUP,
-        )
-
-        assert session.session_type == SessionType.CATCHUP
-
-    @pytest.mark.asyncio
-    async def test_start_session_drill(self, service: SessionService, user_id: UUID):
-        """Test starting a drill session."""
+    async def test_start_session(
+        self,
+        service: SessionService,
+        user_id: UUID,
+        session_type: SessionType,
+        minutes: int,
+    ):
+        """Test starting a new session of each type."""
         session = await service.start_session(
             user_id,
-            available_minutes=20,
-            session_type=SessionType.DRILL,
+            available_minutes=minutes,
+            session_type=session_type,
         )
 
-        assert session.session_type == SessionType.DRILL
+        assert session.id is not None
+        assert session.user_id == user_id
+        assert session.status == SessionStatus.IN_PROGRESS
+        assert session.planned_duration_minutes == minutes
+        assert session.session_type == session_type
 
     @pytest.mark.asyncio
     async def test_start_session_already_active(self, service: SessionService, user_id: UUID):
@@ -110,7 +133,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_end_session_not_found(self, service: SessionService):
         """Test ending non-existent session."""
-        fake_id = uuid4()
+        fake_id = MISSING_TEST_UUID
         with pytest.raises(ValueError, match="Session not found"):
             await service.end_session(fake_id)
 
@@ -143,35 +166,30 @@ class TestSessionService:
         assert plan.total_duration_minutes == 30
         assert len(plan.items) > 0
 
+    @pytest.mark.parametrize("session_type,expected_activity", [
+        # Regular sessions include consumption; drills focus on practice
+        (SessionType.REGULAR, ActivityType.CONTENT_READ),
+        (SessionType.DRILL, ActivityType.DRILL),
+    ], ids=["regular", "drill"])
     @pytest.mark.asyncio
-    async def test_session_plan_regular(self, service: SessionService, user_id: UUID):
-        """Test plan for regular session."""
-        session = await service.start_session(
-            user_id,
-            available_minutes=30,
-            session_type=SessionType.REGULAR,
-        )
-
-        plan = await service.get_session_plan(session.id)
-
-        # Regular session should have consumption and production
-        activity_types = [item.activity_type for item in plan.items]
-        assert ActivityType.CONTENT_READ in activity_types
-
-    @pytest.mark.asyncio
-    async def test_session_plan_drill(self, service: SessionService, user_id: UUID):
-        """Test plan for drill session."""
+    async def test_session_plan_by_type(
+        self,
+        service: SessionService,
+        user_id: UUID,
+        session_type: SessionType,
+        expected_activity: ActivityType,
+    ):
+        """Test that the plan contains the activity expected for the session type."""
         session = await service.start_session(
             user_id,
             available_minutes=30,
-            session_type=SessionType.DRILL,
+            session_type=session_type,
         )
 
         plan = await service.get_session_plan(session.id)
 
-        # Drill session should focus on practice
         activity_types = [item.activity_type for item in plan.items]
-        assert ActivityType.DRILL in activity_types
+        assert expected_activity in activity_types
 
     @pytest.mark.asyncio
     async def test_session_plan_cached(self, service: SessionService, user_id: UUID):
@@ -204,7 +222,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_record_activity_session_not_found(self, service: SessionService):
         """Test recording activity for non-existent session."""
-        fake_id = uuid4()
+        fake_id = MISSING_TEST_UUID
         with pytest.raises(ValueError, match="Session not found"):
             await service.record_activity(
                 session_id=fake_id,
@@ -223,7 +241,7 @@ class TestSessionService:
 
         completed = await service.complete_activity(
             activity_id=activity.id,
-            performance_data={"score": 0.9, "gaps": ["concept A"]},
+            performance_data=_FEYNMAN_PERF,
         )
 
         assert completed.ended_at is not None
@@ -233,7 +251,7 @@ class TestSessionService:
     @pytest.mark.asyncio
     async def test_complete_activity_not_found(self, service: SessionService):
         """Test completing non-existent activity."""
-        fake_id = uuid4()
+        fake_id = MISSING_TEST_UUID
         with pytest.raises(ValueError, match="Activity not found"):
             await service.complete_activity(fake_id)
 
@@ -243,8 +261,10 @@ class TestSessionService:
         session = await service.start_session(user_id)
 
         # Record multiple activities
-        await service.record_activity(session.id, ActivityType.CONTENT_READ)
-        await service.record_activity(session.id, ActivityType.QUIZ)
+        await asyncio.gather(
+            service.record_activity(session.id, ActivityType.CONTENT_READ),
+            service.record_activity(session.id, ActivityType.QUIZ),
+        )
 
         activities = await service.get_session_activities(session.id)
 
@@ -274,38 +294,30 @@ class TestSessionService:
         # Newest first
         assert history[0].id == session2.id
 
+    @pytest.mark.parametrize("include_abandoned,expected_count", [
+        (False, 1),
+        (True, 2),
+    ], ids=["excludes_abandoned", "includes_abandoned"])
     @pytest.mark.asyncio
-    async def test_get_session_history_excludes_abandoned(
-        self,
-        service: SessionService,
-        user_id: UUID,
-    ):
-        """Test that abandoned sessions are excluded by default."""
-        session1 = await service.start_session(user_id)
-        await service.end_session(session1.id)
-
-        session2 = await service.start_session(user_id)
-        await service.abandon_session(session2.id)
-
-        history = await service.get_session_history(user_id, include_abandoned=False)
-        assert len(history) == 1
-        assert history[0].id == session1.id
-
-    @pytest.mark.asyncio
-    async def test_get_session_history_includes_abandoned(
+    async def test_get_session_history_abandoned(
         self,
         service: SessionService,
         user_id: UUID,
+        include_abandoned: bool,
+        expected_count: int,
     ):
-        """Test including abandoned sessions in history."""
+        """Test that abandoned sessions are only listed when requested."""
         session1 = await service.start_session(user_id)
         await service.end_session(session1.id)
 
         session2 = await service.start_session(user_id)
         await service.abandon_session(session2.id)
 
-        history = await service.get_session_history(user_id, include_abandoned=True)
-        assert len(history) == 2
+        history = await service.get_session_history(
+            user_id, include_abandoned=include_abandoned
+        )
+        assert len(history) == expected_count
+        assert history[-1].id == session1.id
 
     # --- Streak Tests ---
 
@@ -354,181 +366,50 @@ class TestSessionSummary:
     """Tests for session summary generation."""
 
     @pytest.fixture
-    def mock_llm(self) -> MagicMock:
-        """Create mock LLM service."""
-        llm = MagicMock()
-        llm.complete = AsyncMock(return_value=MagicMock(content="Preview text"))
-        return llm
-
-    @pytest.fixture
-    def service(self, mock_llm: MagicMock) -> SessionService:
+    def service(self, mock_llm: Mock) -> SessionService:
         """Create SessionService with mocked dependencies."""
+        mock_llm.reset_mock()
         return SessionService(llm_service=mock_llm)
 
+    async def _summarize_one(
+        self,
+        service: SessionService,
+        activity_type: ActivityType,
+        performance_data: dict[str, Any] | None = None,
+    ) -> SessionSummary:
+        """Run a session with a single completed activity and end it."""
+        session = await service.start_session(next_test_uuid())
+        activity = await service.record_activity(session.id, activity_type)
+        await service.complete_activity(activity.id, performance_data)
+        return await service.end_session(session.id)
+
     @pytest.mark.asyncio
     async def test_summary_includes_activities(self, service: SessionService):
         """Test that summary includes activity count."""
-        user_id = uuid4()
-        session = await service.start_session(user_id)
-
-        # Record and complete some activities
-        activity = await service.record_activity(session.id, ActivityType.QUIZ)
-        await service.complete_activity(activity.id)
-
-        summary = await service.end_session(session.id)
+        summary = await self._summarize_one(service, ActivityType.QUIZ)
 
         assert summary.activities_completed == 1
 
     @pytest.mark.asyncio
     async def test_summary_includes_quiz_score(self, service: SessionService):
         """Test that summary includes quiz score."""
-        user_id = uuid4()
-        session = await service.start_session(user_id)
-
-        activity = await service.record_activity(session.id, ActivityType.QUIZ)
-        await service.complete_activity(activity.id, {"score": 0.85})
-
-        summary = await service.end_session(session.id)
+        summary = await self._summarize_one(service, ActivityType.QUIZ, _QUIZ_PERF)
 
         assert summary.quiz_score == 0.85
 
     @pytest.mark.asyncio
     async def test_summary_includes_feynman_score(self, service: SessionService):
         """Test that summary includes Feynman score."""
-        user_id = uuid4()
-        session = await service.start_session(user_id)
-
-        activity = await service.record_activity(session.id, ActivityType.FEYNMAN_DIALOGUE)
-        await service.complete_activity(activity.id, {"score": 0.9})
-
-        summary = await service.end_session(session.id)
+        summary = await self._summarize_one(
+            service, ActivityType.FEYNMAN_DIALOGUE, _FEYNMAN_PERF
+        )
 
         assert summary.feynman_score == 0.9
 
     @pytest.mark.asyncio
     async def test_summary_includes_gaps(self, service: SessionService):
         """Test that summary includes identified gaps."""
-        user_id = uuid4()
-        session = await service.start_session(user_id)
-
-        activity = await service.record_activity(session.id, ActivityType.QUIZ)
-        await service.complete_activity(activity.id, {"gaps": ["concept X", "concept Y"]})
-
-        summary = await service.end_session(session.id)
+        summary = await self._summarize_one(service, ActivityType.QUIZ, _GAPS_PERF)
 
         assert "concept X" in summary.new_gaps_identified
         assert "concept Y" in summary.new_gaps_identified
-
-
-class TestSessionRestorationService:
-    """Tests for SessionRestorationService - session state restoration on login."""
-
-    def test_welcome_context_defaults(self):
-        """Test that WelcomeContext has sensible defaults."""
-        from src.modules.session.restoration_service import WelcomeContext
-
-        ctx = WelcomeContext()
-
-        assert ctx.has_active_session is False
-        assert ctx.active_session_id is None
-        assert ctx.primary_goal is None
-        assert ctx.current_focus is None
-        assert ctx.learning_progress == 0.0
-        assert ctx.current_streak == 0
-        assert ctx.needs_recovery is False
-
-    def test_welcome_context_with_values(self):
-        """Test WelcomeContext with populated values."""
-        from src.modules.session.restoration_service import WelcomeContext
-
-        ctx = WelcomeContext(
-            has_active_session=True,
-            primary_goal="Learn ML",
-            current_focus="Linear algebra",
-            learning_progress=0.45,
-            current_streak=5,
-            streak_at_risk=True,
-            days_since_last_session=1,
-            needs_recovery=False,
-        )
-
-        assert ctx.has_active_session is True
-        assert ctx.primary_goal == "Learn ML"
-        assert ctx.learning_progress == 0.45
-        assert ctx.current_streak == 5
-        assert ctx.streak_at_risk is True
-
-    def test_format_welcome_message_new_user(self):
-        """Test welcome message for new user with no history."""
-        from src.modules.session.restoration_service import (
-            SessionRestorationService,
-            WelcomeContext,
-        )
-
-        service = SessionRestorationService()
-        ctx = WelcomeContext()  # Empty context for new user
-
-        message = service.format_welcome_message(ctx, "test@example.com")
-
-        assert "test@example.com" in message
-        assert "Welcome back" in message
-
-    def test_format_welcome_message_returning_user(self):
-        """Test welcome message for user with learning history."""
-        from src.modules.session.restoration_service import (
-            SessionRestorationService,
-            WelcomeContext,
-        )
-
-        service = SessionRestorationService()
-        ctx = WelcomeContext(
-            primary_goal="Machine Learning",
-            current_focus="Neural networks",
-            learning_progress=0.35,
-            current_streak=7,
-        )
-
-        message = service.format_welcome_message(ctx, "user@example.com")
-
-        assert "user@example.com" in message
-        assert "Machine Learning" in message
-        assert "35%" in message
-        assert "7 days" in message
-
-    def test_format_welcome_message_recovery_needed(self):
-        """Test welcome message when recovery is needed."""
-        from src.modules.session.restoration_service import (
-            SessionRestorationService,
-            WelcomeContext,
-        )
-
-        service = SessionRestorationService()
-        ctx = WelcomeContext(
-            primary_goal="Python",
-            days_since_last_session=5,
-            needs_recovery=True,
-        )
-
-        message = service.format_welcome_message(ctx, "user@example.com")
-
-        assert "5 days" in message
-        assert "recovery" in message.lower()
-
-    def test_format_welcome_message_active_session(self):
-        """Test welcome message when there's an active session."""
-        from src.modules.session.restoration_service import (
-            SessionRestorationService,
-            WelcomeContext,
-        )
-
-        service = SessionRestorationService()
-        ctx = WelcomeContext(
-            has_active_session=True,
-            active_session_id=uuid4(),
-            primary_goal="Data Science",
-        )
-
-        message = service.format_welcome_message(ctx, "user@example.com")
-
-        assert "active session" in message.lower()
-        assert "learner start" in message.lower()
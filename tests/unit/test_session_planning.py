@@ -1,15 +1,30 @@
 """Unit tests for session planning integration in adaptation service."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import date
-from uuid import uuid4
 
 from src.modules.adaptation.service import (
     AdaptationService,
     SessionPlan,
     UserLearningMetrics,
 )
+from tests.conftest import next_test_uuid
+
+# Metrics and plans only carry the user id through, so a fixed one will do
+_USER_ID = next_test_uuid()
+
+# Gap ids are never looked up, so one fixed set serves every test
+_SAMPLE_GAPS = tuple(next_test_uuid() for _ in range(5))
+
+
+@pytest.fixture(scope="module")
+def service():
+    """Create one adaptation service for the stateless planning helpers.
+
+    Classes whose tests seed per-user metrics override this with their own
+    function-scoped service.
+    """
+    return AdaptationService()
 
 
 class TestSessionPlan:
@@ -17,7 +32,7 @@ class TestSessionPlan:
 
     def test_to_dict(self):
         """Test SessionPlan.to_dict() conversion."""
-        user_id = uuid4()
+        user_id = _USER_ID
         plan = SessionPlan(
             user_id=user_id,
             recommended_duration=45,
@@ -45,17 +60,20 @@ class TestSessionPlanning:
     """Tests for session planning methods in AdaptationService."""
 
     @pytest.fixture
-    def service(self):
-        """Create adaptation service with mock LLM."""
-        mock_llm = AsyncMock()
-        return AdaptationService(llm_service=mock_llm)
+    def service(self, stub_llm_service):
+        """Create adaptation service with a stub LLM."""
+        return AdaptationService(llm_service=stub_llm_service)
 
     @pytest.fixture
     def user_id(self):
         """Create test user ID."""
-        return uuid4()
+        return _USER_ID
+
+    @pytest.fixture
+    async def metrics(self, service, user_id):
+        """Seed the service's metrics for user_id and return them for mutation."""
+        return await service._get_or_create_metrics(user_id)
 
-    @pytest.mark.asyncio
     async def test_plan_session_basic(self, service, user_id):
         """Test basic session planning."""
         plan = await service.plan_session(user_id)
@@ -66,21 +84,18 @@ class TestSessionPlanning:
         assert len(plan.activities) > 0
         assert plan.reasoning
 
-    @pytest.mark.asyncio
-    async def test_plan_session_with_requested_duration(self, service, user_id):
-        """Test session planning with requested duration."""
-        plan = await service.plan_session(user_id, requested_duration=60)
-
-        assert plan.recommended_duration == 60
-
-    @pytest.mark.asyncio
-    async def test_plan_session_with_requested_type(self, service, user_id):
-        """Test session planning with requested type."""
-        plan = await service.plan_session(user_id, requested_type="drill")
+    @pytest.mark.parametrize("kwargs,field,expected", [
+        ({"requested_duration": 60}, "recommended_duration", 60),
+        ({"requested_type": "drill"}, "session_type", "drill"),
+    ], ids=["requested_duration", "requested_type"])
+    async def test_plan_session_honours_request(
+        self, service, user_id, kwargs, field, expected
+    ):
+        """Test session planning honours an explicitly requested duration or type."""
+        plan = await service.plan_session(user_id, **kwargs)
 
-        assert plan.session_type == "drill"
+        assert getattr(plan, field) == expected
 
-    @pytest.mark.asyncio
     async def test_plan_session_with_topics(self, service, user_id):
         """Test session planning with specific topics."""
         topics = ["transformers", "attention"]
@@ -89,11 +104,9 @@ class TestSessionPlanning:
         assert "transformers" in plan.focus_areas
         assert "attention" in plan.focus_areas
 
-    @pytest.mark.asyncio
-    async def test_plan_recovery_session(self, service, user_id):
+    async def test_plan_recovery_session(self, service, user_id, metrics):
         """Test session planning triggers recovery for missed days."""
         # Set up metrics with missed days
-        metrics = await service._get_or_create_metrics(user_id)
         metrics.consecutive_missed_days = 5
 
         plan = await service.plan_session(user_id)
@@ -101,23 +114,19 @@ class TestSessionPlanning:
         assert plan.session_type == "recovery"
         assert plan.review_ratio >= 0.7  # Recovery should be review-heavy
 
-    @pytest.mark.asyncio
     async def test_plan_review_session_for_declining_performance(
-        self, service, user_id
+        self, service, user_id, metrics
     ):
         """Test session planning suggests review for declining scores."""
-        metrics = await service._get_or_create_metrics(user_id)
         metrics.quiz_score_trend = "declining"
-        metrics.identified_gaps = [uuid4(), uuid4(), uuid4()]
+        metrics.identified_gaps = list(_SAMPLE_GAPS[:3])
 
         plan = await service.plan_session(user_id)
 
         assert plan.session_type == "review"
 
-    @pytest.mark.asyncio
-    async def test_plan_drill_session_for_high_performers(self, service, user_id):
+    async def test_plan_drill_session_for_high_performers(self, service, user_id, metrics):
         """Test session planning suggests drill for high performers."""
-        metrics = await service._get_or_create_metrics(user_id)
         metrics.avg_quiz_score = 0.9
         metrics.current_pace = "fast"
 
@@ -129,98 +138,44 @@ class TestSessionPlanning:
 class TestDetermineSessionType:
     """Tests for _determine_session_type method."""
 
-    @pytest.fixture
-    def service(self):
-        """Create adaptation service."""
-        return AdaptationService()
-
-    def test_recovery_for_missed_days(self, service):
-        """Test recovery type for missed days."""
-        metrics = UserLearningMetrics(user_id=uuid4())
-        metrics.consecutive_missed_days = 5
-
-        session_type = service._determine_session_type(metrics)
-
-        assert session_type == "recovery"
-
-    def test_review_for_many_gaps(self, service):
-        """Test review type for many gaps."""
-        metrics = UserLearningMetrics(user_id=uuid4())
-        metrics.identified_gaps = [uuid4() for _ in range(5)]
-
-        session_type = service._determine_session_type(metrics)
-
-        assert session_type == "review"
-
-    def test_review_for_declining_trend(self, service):
-        """Test review type for declining performance."""
-        metrics = UserLearningMetrics(user_id=uuid4())
-        metrics.quiz_score_trend = "declining"
+    @pytest.mark.parametrize("overrides,expected", [
+        ({"consecutive_missed_days": 5}, "recovery"),
+        ({"identified_gaps": list(_SAMPLE_GAPS)}, "review"),
+        ({"quiz_score_trend": "declining"}, "review"),
+        ({"avg_quiz_score": 0.9, "current_pace": "fast"}, "drill"),
+        ({}, "regular"),
+    ], ids=["missed_days", "many_gaps", "declining_trend", "high_performance", "default"])
+    def test_determine_session_type(self, service, overrides, expected):
+        """Test the session type chosen for each metrics profile."""
+        metrics = UserLearningMetrics(user_id=_USER_ID, **overrides)
 
         session_type = service._determine_session_type(metrics)
 
-        assert session_type == "review"
-
-    def test_drill_for_high_performance(self, service):
-        """Test drill type for high performers."""
-        metrics = UserLearningMetrics(user_id=uuid4())
-        metrics.avg_quiz_score = 0.9
-        metrics.current_pace = "fast"
-
-        session_type = service._determine_session_type(metrics)
-
-        assert session_type == "drill"
-
-    def test_regular_default(self, service):
-        """Test regular as default type."""
-        metrics = UserLearningMetrics(user_id=uuid4())
-
-        session_type = service._determine_session_type(metrics)
-
-        assert session_type == "regular"
+        assert session_type == expected
 
 
 class TestRecommendDuration:
     """Tests for _recommend_duration method."""
 
-    @pytest.fixture
-    def service(self):
-        """Create adaptation service."""
-        return AdaptationService()
-
-    def test_recovery_shorter(self, service):
-        """Test recovery sessions are shorter."""
-        metrics = UserLearningMetrics(user_id=uuid4())
-        metrics.avg_session_duration = 60
-
-        duration = service._recommend_duration(metrics, "recovery")
+    @pytest.mark.parametrize("session_type,overrides", [
+        ("recovery", {}),
+        ("drill", {}),
+        # User often doesn't finish
+        ("regular", {"completion_rate": 0.5}),
+    ], ids=["recovery", "drill", "low_completion_rate"])
+    def test_shorter_than_average(self, service, session_type, overrides):
+        """Test recovery, drill and low-completion sessions are shorter than average."""
+        metrics = UserLearningMetrics(user_id=_USER_ID, avg_session_duration=60, **overrides)
 
-        assert duration < 60  # Should be shorter than average
-
-    def test_drill_focused(self, service):
-        """Test drill sessions are focused (shorter)."""
-        metrics = UserLearningMetrics(user_id=uuid4())
-        metrics.avg_session_duration = 60
-
-        duration = service._recommend_duration(metrics, "drill")
-
-        assert duration < 60
-
-    def test_low_completion_rate_shorter(self, service):
-        """Test low completion rate leads to shorter sessions."""
-        metrics = UserLearningMetrics(user_id=uuid4())
-        metrics.avg_session_duration = 60
-        metrics.completion_rate = 0.5  # User often doesn't finish
-
-        duration = service._recommend_duration(metrics, "regular")
+        duration = service._recommend_duration(metrics, session_type)
 
         assert duration < 60
 
     def test_high_completion_rate_longer(self, service):
         """Test high completion rate allows longer sessions."""
-        metrics = UserLearningMetrics(user_id=uuid4())
-        metrics.avg_session_duration = 60
-        metrics.completion_rate = 0.98
+        metrics = UserLearningMetrics(
+            user_id=_USER_ID, avg_session_duration=60, completion_rate=0.98
+        )
 
         duration = service._recommend_duration(metrics, "regular")
 
@@ -228,8 +183,8 @@ class TestRecommendDuration:
 
     def test_duration_clamped(self, service):
         """Test duration is clamped to reasonable bounds."""
-        metrics = UserLearningMetrics(user_id=uuid4())
-        metrics.avg_session_duration = 200  # Very long average
+        # Very long average
+        metrics = UserLearningMetrics(user_id=_USER_ID, avg_session_duration=200)
 
         duration = service._recommend_duration(metrics, "regular")
 
@@ -239,65 +194,41 @@ class TestRecommendDuration:
 class TestCalculateReviewRatio:
     """Tests for _calculate_review_ratio method."""
 
-    @pytest.fixture
-    def service(self):
-        """Create adaptation service."""
-        return AdaptationService()
-
-    def test_recovery_high_review(self, service):
-        """Test recovery has high review ratio."""
-        metrics = UserLearningMetrics(user_id=uuid4())
-
-        ratio = service._calculate_review_ratio(metrics, "recovery")
-
-        assert ratio >= 0.7
-
-    def test_drill_low_review(self, service):
-        """Test drill has low review ratio."""
-        metrics = UserLearningMetrics(user_id=uuid4())
-
-        ratio = service._calculate_review_ratio(metrics, "drill")
-
-        assert ratio <= 0.4
+    @pytest.mark.parametrize("session_type,low,high", [
+        ("recovery", 0.7, 1.0),
+        ("drill", 0.0, 0.4),
+    ], ids=["recovery_high_review", "drill_low_review"])
+    def test_review_ratio_by_type(self, service, session_type, low, high):
+        """Test the review ratio range for each session type."""
+        metrics = UserLearningMetrics(user_id=_USER_ID)
 
-    def test_declining_trend_increases_review(self, service):
-        """Test declining trend increases review."""
-        metrics = UserLearningMetrics(user_id=uuid4())
-        metrics.quiz_score_trend = "declining"
-
-        ratio_declining = service._calculate_review_ratio(metrics, "regular")
-
-        metrics.quiz_score_trend = "stable"
-        ratio_stable = service._calculate_review_ratio(metrics, "regular")
+        ratio = service._calculate_review_ratio(metrics, session_type)
 
-        assert ratio_declining > ratio_stable
+        assert low <= ratio <= high
 
-    def test_gaps_increase_review(self, service):
-        """Test identified gaps increase review ratio."""
-        metrics = UserLearningMetrics(user_id=uuid4())
+    @pytest.mark.parametrize("overrides", [
+        {"quiz_score_trend": "declining"},
+        {"identified_gaps": list(_SAMPLE_GAPS)},
+    ], ids=["declining_trend", "gaps"])
+    def test_increases_review(self, service, overrides):
+        """Test declining performance and identified gaps increase review."""
+        baseline = UserLearningMetrics(user_id=_USER_ID)
+        metrics = UserLearningMetrics(user_id=baseline.user_id, **overrides)
 
-        ratio_no_gaps = service._calculate_review_ratio(metrics, "regular")
+        ratio_baseline = service._calculate_review_ratio(baseline, "regular")
+        ratio = service._calculate_review_ratio(metrics, "regular")
 
-        metrics.identified_gaps = [uuid4() for _ in range(5)]
-        ratio_with_gaps = service._calculate_review_ratio(metrics, "regular")
-
-        assert ratio_with_gaps > ratio_no_gaps
+        assert ratio > ratio_baseline
 
 
 class TestPlanActivities:
     """Tests for _plan_activities method."""
 
-    @pytest.fixture
-    def service(self):
-        """Create adaptation service."""
-        return AdaptationService()
-
     @pytest.fixture
     def user_id(self):
         """Create test user ID."""
-        return uuid4()
+        return _USER_ID
 
-    @pytest.mark.asyncio
     async def test_activities_include_warmup(self, service, user_id):
         """Test activities start with warmup."""
         metrics = UserLearningMetrics(user_id=user_id)
@@ -313,7 +244,6 @@ class TestPlanActivities:
 
         assert activities[0]["type"] == "warmup"
 
-    @pytest.mark.asyncio
     async def test_activities_include_review(self, service, user_id):
         """Test activities include review."""
         metrics = UserLearningMetrics(user_id=user_id)
@@ -330,7 +260,6 @@ class TestPlanActivities:
         types = [a["type"] for a in activities]
         assert "review" in types
 
-    @pytest.mark.asyncio
     async def test_activities_total_duration(self, service, user_id):
         """Test activities don't exceed requested duration."""
         metrics = UserLearningMetrics(user_id=user_id)
@@ -356,10 +285,9 @@ class TestGetOptimalSessionTime:
         """Create adaptation service."""
         return AdaptationService()
 
-    @pytest.mark.asyncio
     async def test_returns_recommendation(self, service):
         """Test returns time recommendation."""
-        user_id = uuid4()
+        user_id = _USER_ID
 
         result = await service.get_optimal_session_time(user_id)
 
@@ -367,10 +295,9 @@ class TestGetOptimalSessionTime:
         assert "confidence" in result
         assert "reasoning" in result
 
-    @pytest.mark.asyncio
     async def test_confidence_higher_with_more_sessions(self, service):
         """Test confidence increases with more session history."""
-        user_id = uuid4()
+        user_id = _USER_ID
         metrics = await service._get_or_create_metrics(user_id)
         metrics.sessions_last_30_days = 5
 
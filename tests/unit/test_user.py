@@ -2,7 +2,6 @@
 
 import pytest
 from datetime import datetime
-from uuid import uuid4
 from sqlalchemy import text
 
 from src.modules.user import get_user_service
@@ -15,6 +14,18 @@ from src.modules.session.models import UserLearningPatternModel
 from src.modules.auth import get_auth_service
 from src.shared.database import get_db_session
 from src.shared.models import SourceType
+from tests.conftest import MISSING_TEST_UUID
+
+# These tests share database tables; keep them on one worker under `pytest -n`
+pytestmark = pytest.mark.xdist_group("database")
+
+# Every table keyed on users(id) is ON DELETE CASCADE, so deleting the test
+# users also removes their profiles, patterns and source configs
+_CLEANUP_STATEMENTS = (
+    "DELETE FROM password_reset_tokens",
+    "DELETE FROM refresh_tokens",
+    "DELETE FROM users WHERE email LIKE 'test%@example.com'",
+)
 
 
 @pytest.fixture
@@ -29,32 +40,15 @@ async def auth_service():
     return get_auth_service()
 
 
-@pytest.fixture
-async def clean_db():
-    """Clean database before each test."""
-    async with get_db_session() as session:
-        # Clean up test data
-        await session.execute(text("DELETE FROM user_source_configs WHERE user_id IN (SELECT id FROM users WHERE email LIKE 'test%@example.com')"))
-        await session.execute(text("DELETE FROM user_learning_patterns WHERE user_id IN (SELECT id FROM users WHERE email LIKE 'test%@example.com')"))
-        await session.execute(text("DELETE FROM user_profiles WHERE user_id IN (SELECT id FROM users WHERE email LIKE 'test%@example.com')"))
-        await session.execute(text("DELETE FROM password_reset_tokens"))
-        await session.execute(text("DELETE FROM refresh_tokens"))
-        await session.execute(text("DELETE FROM users WHERE email LIKE 'test%@example.com'"))
-        await session.commit()
-    yield
-    # Cleanup after test
+async def _delete_test_rows():
+    """Remove rows committed by tests that run outside db_transaction."""
     async with get_db_session() as session:
-        await session.execute(text("DELETE FROM user_source_configs WHERE user_id IN (SELECT id FROM users WHERE email LIKE 'test%@example.com')"))
-        await session.execute(text("DELETE FROM user_learning_patterns WHERE user_id IN (SELECT id FROM users WHERE email LIKE 'test%@example.com')"))
-        await session.execute(text("DELETE FROM user_profiles WHERE user_id IN (SELECT id FROM users WHERE email LIKE 'test%@example.com')"))
-        await session.execute(text("DELETE FROM password_reset_tokens"))
-        await session.execute(text("DELETE FROM refresh_tokens"))
-        await session.execute(text("DELETE FROM users WHERE email LIKE 'test%@example.com'"))
-        await session.commit()
+        for statement in _CLEANUP_STATEMENTS:
+            await session.execute(text(statement))
 
 
 @pytest.fixture
-async def test_user(auth_service, clean_db):
+async def test_user(auth_service, db_transaction):
     """Create a test user for profile testing."""
     result = await auth_service.register(
         email="testuser@example.com",
@@ -63,10 +57,26 @@ async def test_user(auth_service, clean_db):
     return result.user_id
 
 
+@pytest.fixture
+async def committed_user(auth_service):
+    """Create a test user whose writes are really committed.
+
+    The updated_at trigger uses NOW(), which is frozen for the length of a
+    transaction, so tests comparing timestamps across writes can't run
+    inside db_transaction's rollback.
+    """
+    await _delete_test_rows()
+    result = await auth_service.register(
+        email="testuser@example.com",
+        password="TestPass123"
+    )
+    yield result.user_id
+    await _delete_test_rows()
+
+
 class TestProfileCreation:
     """Test user profile creation."""
 
-    @pytest.mark.asyncio
     async def test_create_profile_success(self, user_service, test_user):
         """Test successful profile creation."""
         # Note: Profile is auto-created by database trigger when user is created
@@ -83,16 +93,14 @@ class TestProfileCreation:
         assert profile.goals == []
         assert profile.preferred_sources == []
 
-    @pytest.mark.asyncio
     async def test_create_profile_duplicate(self, user_service, test_user):
         """Test creating duplicate profile raises error."""
         with pytest.raises(ValueError, match="Profile already exists"):
             await user_service.create_profile(test_user)
 
-    @pytest.mark.asyncio
     async def test_get_nonexistent_profile(self, user_service):
         """Test getting profile for non-existent user."""
-        fake_user_id = uuid4()
+        fake_user_id = MISSING_TEST_UUID
         profile = await user_service.get_profile(fake_user_id)
 
         assert profile is None
@@ -101,7 +109,6 @@ class TestProfileCreation:
 class TestProfileUpdate:
     """Test profile update operations."""
 
-    @pytest.mark.asyncio
     async def test_update_profile_basic_fields(self, user_service, test_user):
         """Test updating basic profile fields."""
         updated = await user_service.update_profile(
@@ -116,7 +123,6 @@ class TestProfileUpdate:
         assert "Learn AI/ML" in updated.goals
         assert updated.timezone == "America/New_York"
 
-    @pytest.mark.asyncio
     async def test_update_profile_sources(self, user_service, test_user):
         """Test updating preferred sources."""
         updated = await user_service.update_profile(
@@ -128,10 +134,9 @@ class TestProfileUpdate:
         assert SourceType.ARXIV in updated.preferred_sources
         assert SourceType.YOUTUBE in updated.preferred_sources
 
-    @pytest.mark.asyncio
     async def test_update_nonexistent_profile(self, user_service):
         """Test updating non-existent profile raises error."""
-        fake_user_id = uuid4()
+        fake_user_id = MISSING_TEST_UUID
 
         with pytest.raises(ValueError, match="Profile not found"):
             await user_service.update_profile(
@@ -139,14 +144,12 @@ class TestProfileUpdate:
                 background="Test"
             )
 
-    @pytest.mark.asyncio
     async def test_update_time_budget(self, user_service, test_user):
         """Test updating time budget."""
         updated = await user_service.update_time_budget(test_user, 60)
 
         assert updated.time_budget_minutes == 60
 
-    @pytest.mark.asyncio
     async def test_update_time_budget_invalid(self, user_service, test_user):
         """Test updating time budget with invalid values."""
         with pytest.raises(ValueError, match="Time budget must be between"):
@@ -159,7 +162,6 @@ class TestProfileUpdate:
 class TestOnboarding:
     """Test onboarding completion."""
 
-    @pytest.mark.asyncio
     async def test_complete_onboarding_success(self, user_service, test_user):
         """Test successful onboarding completion."""
         onboarding_data = OnboardingData(
@@ -184,7 +186,6 @@ class TestOnboarding:
         assert len(profile.preferred_sources) == 3
         assert profile.timezone == "Europe/London"
 
-    @pytest.mark.asyncio
     async def test_complete_onboarding_updates_existing(self, user_service, test_user):
         """Test onboarding updates existing profile."""
         # First update
@@ -208,7 +209,6 @@ class TestOnboarding:
 class TestLearningPatterns:
     """Test learning pattern retrieval."""
 
-    @pytest.mark.asyncio
     async def test_get_learning_pattern_no_sessions(self, user_service, test_user):
         """Test getting learning pattern with no sessions returns None."""
         pattern = await user_service.get_learning_pattern(test_user)
@@ -216,16 +216,14 @@ class TestLearningPatterns:
         # Should return None because total_sessions is 0
         assert pattern is None
 
-    @pytest.mark.asyncio
-    async def test_get_learning_pattern_with_data(self, user_service, test_user):
+    async def test_get_learning_pattern_with_data(self, user_service, test_user, db_transaction):
         """Test getting learning pattern with session data."""
-        # Manually update learning pattern to simulate sessions
-        async with get_db_session() as session:
-            result = await session.execute(
-                text("UPDATE user_learning_patterns SET total_sessions = 5, avg_session_duration = 25.5, current_streak = 3 WHERE user_id = :user_id"),
-                {"user_id": test_user}
-            )
-            await session.commit()
+        # Manually update learning pattern to simulate sessions; the service
+        # reads through the same connection, so no separate commit is needed
+        await db_transaction.execute(
+            text("UPDATE user_learning_patterns SET total_sessions = 5, avg_session_duration = 25.5, current_streak = 3 WHERE user_id = :user_id"),
+            {"user_id": test_user}
+        )
 
         pattern = await user_service.get_learning_pattern(test_user)
 
@@ -234,10 +232,9 @@ class TestLearningPatterns:
         assert pattern.avg_session_duration == 25.5
         assert pattern.current_streak == 3
 
-    @pytest.mark.asyncio
     async def test_get_learning_pattern_nonexistent_user(self, user_service):
         """Test getting pattern for non-existent user."""
-        fake_user_id = uuid4()
+        fake_user_id = MISSING_TEST_UUID
         pattern = await user_service.get_learning_pattern(fake_user_id)
 
         assert pattern is None
@@ -246,29 +243,22 @@ class TestLearningPatterns:
 class TestSourceConfiguration:
     """Test content source configuration."""
 
-    @pytest.mark.asyncio
-    async def test_add_source_new(self, user_service, test_user):
+    @pytest.mark.parametrize("source_type,config", [
+        (SourceType.ARXIV, {"feeds": ["cs.AI", "cs.LG"], "max_papers_per_day": 5}),
+        (SourceType.YOUTUBE, {"channels": ["channel1"]}),
+        (SourceType.GITHUB, {"repos": ["owner/repo1"]}),
+        (SourceType.REDDIT, {"subreddits": ["MachineLearning"]}),
+    ], ids=["arxiv", "youtube", "github", "reddit"])
+    async def test_add_source_new(self, user_service, test_user, source_type, config):
         """Test adding a new content source."""
-        config = {
-            "feeds": ["cs.AI", "cs.LG"],
-            "max_papers_per_day": 5
-        }
-
-        success = await user_service.add_source(
-            test_user,
-            SourceType.ARXIV,
-            config
-        )
+        success = await user_service.add_source(test_user, source_type, config)
 
         assert success is True
 
         # Verify it was added
-        retrieved_config = await user_service.get_source_config(test_user, SourceType.ARXIV)
-        assert retrieved_config is not None
-        assert retrieved_config["feeds"] == ["cs.AI", "cs.LG"]
-        assert retrieved_config["max_papers_per_day"] == 5
+        retrieved_config = await user_service.get_source_config(test_user, source_type)
+        assert retrieved_config == config
 
-    @pytest.mark.asyncio
     async def test_add_source_updates_existing(self, user_service, test_user):
         """Test adding source updates existing configuration."""
         # Add initial config
@@ -284,7 +274,6 @@ class TestSourceConfiguration:
         assert len(retrieved["channels"]) == 2
         assert retrieved["max_videos"] == 10
 
-    @pytest.mark.asyncio
     async def test_add_source_updates_profile_preferences(self, user_service, test_user):
         """Test adding source updates profile's preferred_sources."""
         config = {"repos": ["owner/repo1"]}
@@ -294,7 +283,6 @@ class TestSourceConfiguration:
         profile = await user_service.get_profile(test_user)
         assert SourceType.GITHUB in profile.preferred_sources
 
-    @pytest.mark.asyncio
     async def test_remove_source_success(self, user_service, test_user):
         """Test removing a content source."""
         # Add source first
@@ -311,7 +299,6 @@ class TestSourceConfiguration:
         # Verify it's gone
         assert await user_service.get_source_config(test_user, SourceType.REDDIT) is None
 
-    @pytest.mark.asyncio
     async def test_remove_source_updates_profile(self, user_service, test_user):
         """Test removing source updates profile's preferred_sources."""
         # Add source
@@ -329,7 +316,6 @@ class TestSourceConfiguration:
         updated_profile = await user_service.get_profile(test_user)
         assert SourceType.NEWSLETTER not in updated_profile.preferred_sources
 
-    @pytest.mark.asyncio
     async def test_remove_nonexistent_source(self, user_service, test_user):
         """Test removing non-existent source."""
         success = await user_service.remove_source(test_user, SourceType.TWITTER)
@@ -337,7 +323,6 @@ class TestSourceConfiguration:
         # Should return False (no rows deleted)
         assert success is False
 
-    @pytest.mark.asyncio
     async def test_get_source_config_nonexistent(self, user_service, test_user):
         """Test getting config for non-configured source."""
         config = await user_service.get_source_config(test_user, SourceType.DISCORD)
@@ -348,7 +333,6 @@ class TestSourceConfiguration:
 class TestMultipleSources:
     """Test managing multiple content sources."""
 
-    @pytest.mark.asyncio
     async def test_add_multiple_sources(self, user_service, test_user):
         """Test adding multiple different sources."""
         # Add multiple sources
@@ -388,7 +372,6 @@ class TestMultipleSources:
 class TestProfilePersistence:
     """Test profile data persistence and retrieval."""
 
-    @pytest.mark.asyncio
     async def test_profile_timestamps(self, user_service, test_user):
         """Test profile timestamps are set correctly."""
         profile = await user_service.get_profile(test_user)
@@ -398,24 +381,19 @@ class TestProfilePersistence:
         assert isinstance(profile.created_at, datetime)
         assert isinstance(profile.updated_at, datetime)
 
-    @pytest.mark.asyncio
-    async def test_profile_updated_at_changes(self, user_service, test_user):
+    async def test_profile_updated_at_changes(self, user_service, committed_user):
         """Test updated_at changes when profile is modified."""
-        initial_profile = await user_service.get_profile(test_user)
+        initial_profile = await user_service.get_profile(committed_user)
         initial_updated = initial_profile.updated_at
 
-        # Small delay to ensure timestamp difference
-        import asyncio
-        await asyncio.sleep(0.1)
-
-        # Update profile
-        await user_service.update_profile(test_user, background="New background")
+        # Update profile. No delay needed: the trigger stamps NOW() from the
+        # update's own transaction, which starts after registration committed
+        await user_service.update_profile(committed_user, background="New background")
 
         # Check updated_at changed
-        updated_profile = await user_service.get_profile(test_user)
+        updated_profile = await user_service.get_profile(committed_user)
         assert updated_profile.updated_at > initial_updated
 
-    @pytest.mark.asyncio
     async def test_profile_data_integrity(self, user_service, test_user):
         """Test profile data is correctly stored and retrieved."""
         # Update with comprehensive data
@@ -4,7 +4,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import insert, select, text
 
 from src.modules.content.models import ContentModel, TopicModel
 from src.modules.content.vector_search import (
@@ -15,6 +15,15 @@ from src.modules.content.vector_search import (
 from src.shared.database import get_db_session
 from src.shared.models import SourceType
 
+# These tests share database tables; keep them on one worker under `pytest -n`
+pytestmark = pytest.mark.xdist_group("database")
+
+
+@pytest.fixture(scope="module")
+def service():
+    """Create vector search service shared by the module (it holds no state)."""
+    return VectorSearchService()
+
 
 @pytest.fixture
 async def sample_embeddings():
@@ -32,94 +41,92 @@ async def sample_embeddings():
 
 
 @pytest.fixture
-async def sample_content(sample_embeddings):
-    """Create sample content with embeddings in the database."""
-    async with get_db_session() as session:
-        # Create topics
-        topic1 = TopicModel(id=uuid4(), name="machine learning")
-        topic2 = TopicModel(id=uuid4(), name="deep learning")
-        session.add(topic1)
-        session.add(topic2)
-        await session.flush()
-
-        # Create content items
-        content1 = ContentModel(
-            id=uuid4(),
-            source_type=SourceType.ARXIV.value,
-            source_url="https://arxiv.org/abs/1",
-            title="Machine Learning Basics",
-            summary="Introduction to ML",
-            embedding=sample_embeddings["base"],
-            topics=[topic1.id],
-            difficulty_level=2,
-            importance_score=0.8,
-            created_at=datetime.utcnow(),
-            processed_at=datetime.utcnow(),
-        )
+async def sample_content(sample_embeddings, db_transaction):
+    """Create sample content with embeddings in the database.
 
-        content2 = ContentModel(
-            id=uuid4(),
-            source_type=SourceType.ARXIV.value,
-            source_url="https://arxiv.org/abs/2",
-            title="Advanced ML Techniques",
-            summary="Advanced techniques in ML",
-            embedding=sample_embeddings["similar"],
-            topics=[topic1.id, topic2.id],
-            difficulty_level=4,
-            importance_score=0.9,
-            created_at=datetime.utcnow(),
-            processed_at=datetime.utcnow(),
-        )
+    The rows live only inside the test's rolled-back transaction.
+    """
+    ids = {name: uuid4() for name in ("content1", "content2", "content3", "content4")}
+    ids["topic1"] = uuid4()
+    ids["topic2"] = uuid4()
+    now = datetime.utcnow()
 
-        content3 = ContentModel(
-            id=uuid4(),
-            source_type=SourceType.BLOG.value,
-            source_url="https://blog.example.com/3",
-            title="Completely Different Topic",
-            summary="Something unrelated",
-            embedding=sample_embeddings["different"],
-            topics=[],
-            difficulty_level=1,
-            importance_score=0.5,
-            created_at=datetime.utcnow(),
-            processed_at=datetime.utcnow(),
+    async with get_db_session() as session:
+        # Create topics
+        await session.execute(
+            insert(TopicModel),
+            [
+                {"id": ids["topic1"], "name": "machine learning"},
+                {"id": ids["topic2"], "name": "deep learning"},
+            ],
         )
 
-        # Content without embedding
-        content4 = ContentModel(
-            id=uuid4(),
-            source_type=SourceType.YOUTUBE.value,
-            source_url="https://youtube.com/4",
-            title="No Embedding",
-            summary="This has no embedding",
-            embedding=None,
-            topics=[],
-            difficulty_level=3,
-            created_at=datetime.utcnow(),
-            processed_at=datetime.utcnow(),
+        # Create content items
+        await session.execute(
+            insert(ContentModel),
+            [
+                {
+                    "id": ids["content1"],
+                    "source_type": SourceType.ARXIV.value,
+                    "source_url": "https://arxiv.org/abs/1",
+                    "title": "Machine Learning Basics",
+                    "summary": "Introduction to ML",
+                    "embedding": sample_embeddings["base"],
+                    "topics": [ids["topic1"]],
+                    "difficulty_level": 2,
+                    "importance_score": 0.8,
+                    "created_at": now,
+                    "processed_at": now,
+                },
+                {
+                    "id": ids["content2"],
+                    "source_type": SourceType.ARXIV.value,
+                    "source_url": "https://arxiv.org/abs/2",
+                    "title": "Advanced ML Techniques",
+                    "summary": "Advanced techniques in ML",
+                    "embedding": sample_embeddings["similar"],
+                    "topics": [ids["topic1"], ids["topic2"]],
+                    "difficulty_level": 4,
+                    "importance_score": 0.9,
+                    "created_at": now,
+                    "processed_at": now,
+                },
+                {
+                    "id": ids["content3"],
+                    "source_type": SourceType.BLOG.value,
+                    "source_url": "https://blog.example.com/3",
+                    "title": "Completely Different Topic",
+                    "summary": "Something unrelated",
+                    "embedding": sample_embeddings["different"],
+                    "topics": [],
+                    "difficulty_level": 1,
+                    "importance_score": 0.5,
+                    "created_at": now,
+                    "processed_at": now,
+                },
+                # Content without embedding
+                {
+                    "id": ids["content4"],
+                    "source_type": SourceType.YOUTUBE.value,
+                    "source_url": "https://youtube.com/4",
+                    "title": "No Embedding",
+                    "summary": "This has no embedding",
+                    "embedding": None,
+                    "topics": [],
+                    "difficulty_level": 3,
+                    "created_at": now,
+                    "processed_at": now,
+                },
+            ],
         )
-
-        session.add_all([content1, content2, content3, content4])
         await session.commit()
 
-        return {
-            "content1": content1.id,
-            "content2": content2.id,
-            "content3": content3.id,
-            "content4": content4.id,
-            "topic1": topic1.id,
-            "topic2": topic2.id,
-        }
+    return ids
 
 
 class TestVectorSearchService:
     """Test vector search service."""
 
-    @pytest.fixture
-    def service(self):
-        """Create vector search service."""
-        return VectorSearchService()
-
     @pytest.mark.asyncio
     async def test_similarity_search_basic(self, service, sample_content, sample_embeddings):
         """Test basic similarity search."""
@@ -175,12 +182,15 @@ class TestVectorSearchService:
 
         # Should only return ARXIV content
         async with get_db_session() as session:
-            for content_id, _ in results:
-                result = await session.execute(
-                    select(ContentModel.source_type).where(ContentModel.id == content_id)
+            result = await session.execute(
+                select(ContentModel.source_type).where(
+                    ContentModel.id.in_([cid for cid, _ in results])
                 )
-                source_type = result.scalar_one()
-                assert source_type == SourceType.ARXIV.value
+            )
+            source_types = result.scalars().all()
+
+        assert len(source_types) == len(results)
+        assert all(st == SourceType.ARXIV.value for st in source_types)
 
     @pytest.mark.asyncio
     async def test_similarity_search_difficulty_filter(
@@ -196,12 +206,15 @@ class TestVectorSearchService:
 
         # Check difficulty levels
         async with get_db_session() as session:
-            for content_id, _ in results:
-                result = await session.execute(
-                    select(ContentModel.difficulty_level).where(ContentModel.id == content_id)
+            result = await session.execute(
+                select(ContentModel.difficulty_level).where(
+                    ContentModel.id.in_([cid for cid, _ in results])
                 )
-                difficulty = result.scalar_one()
-                assert 3 <= difficulty <= 5
+            )
+            difficulties = result.scalars().all()
+
+        assert len(difficulties) == len(results)
+        assert all(3 <= difficulty <= 5 for difficulty in difficulties)
 
     @pytest.mark.asyncio
     async def test_similarity_search_excludes_no_embedding(
@@ -249,38 +262,32 @@ class TestVectorSearchService:
             assert 0.0 <= similarity <= 1.0
 
     @pytest.mark.asyncio
-    async def test_find_similar_to_content(self, service, sample_content):
+    @pytest.mark.parametrize(
+        "exclude_self,expected_first",
+        [(True, "content2"), (False, "content1")],
+        ids=["exclude_self", "include_self"],
+    )
+    async def test_find_similar_to_content(
+        self, service, sample_content, exclude_self, expected_first
+    ):
         """Test finding content similar to a specific content item."""
         results = await service.find_similar_to_content(
             content_id=sample_content["content1"],
             limit=5,
-            exclude_self=True,
+            exclude_self=exclude_self,
         )
 
         # Should return similar items
         assert len(results) > 0
 
-        # Should not include the source content itself
+        # Source content is only included when not excluded
         content_ids = [cid for cid, _ in results]
-        assert sample_content["content1"] not in content_ids
+        assert (sample_content["content1"] in content_ids) is not exclude_self
 
-        # Most similar should be content2
-        assert results[0][0] == sample_content["content2"]
-
-    @pytest.mark.asyncio
-    async def test_find_similar_include_self(self, service, sample_content):
-        """Test finding similar content including source."""
-        results = await service.find_similar_to_content(
-            content_id=sample_content["content1"],
-            limit=5,
-            exclude_self=False,
-        )
-
-        # Source content should be included and be first (100% similar to itself)
-        content_ids = [cid for cid, _ in results]
-        assert sample_content["content1"] in content_ids
-        assert results[0][0] == sample_content["content1"]
-        assert results[0][1] > 0.99  # Nearly 1.0
+        # Source itself (100% similar) or else content2 should come first
+        assert results[0][0] == sample_content[expected_first]
+        if not exclude_self:
+            assert results[0][1] > 0.99  # Nearly 1.0
 
     @pytest.mark.asyncio
     async def test_find_similar_nonexistent_content(self, service):
@@ -324,52 +331,24 @@ class TestVectorSearchService:
         assert sample_content["content1"] in top_ids or sample_content["content2"] in top_ids
 
     @pytest.mark.asyncio
-    async def test_hybrid_search_weight_validation(
-        self, service, sample_content, sample_embeddings
-    ):
-        """Test hybrid search with non-normalized weights."""
-        # Weights don't sum to 1.0 - should still work with warning
-        results = await service.hybrid_search(
-            query_text="machine learning",
-            query_embedding=sample_embeddings["base"],
-            limit=5,
-            vector_weight=0.8,
-            keyword_weight=0.5,  # Sum = 1.3
-        )
-
-        # Should still return results despite warning
-        assert len(results) > 0
-
-    @pytest.mark.asyncio
-    async def test_hybrid_search_pure_vector(
-        self, service, sample_content, sample_embeddings
-    ):
-        """Test hybrid search with vector-only weighting."""
-        results = await service.hybrid_search(
-            query_text="machine learning",
-            query_embedding=sample_embeddings["base"],
-            limit=5,
-            vector_weight=1.0,
-            keyword_weight=0.0,
-        )
-
-        # Should work like pure vector search
-        assert len(results) > 0
-
-    @pytest.mark.asyncio
-    async def test_hybrid_search_pure_keyword(
-        self, service, sample_content, sample_embeddings
+    @pytest.mark.parametrize(
+        "vector_weight,keyword_weight",
+        [(0.8, 0.5), (1.0, 0.0), (0.0, 1.0)],
+        ids=["non_normalized", "pure_vector", "pure_keyword"],
+    )
+    async def test_hybrid_search_weighting(
+        self, service, sample_content, sample_embeddings, vector_weight, keyword_weight
     ):
-        """Test hybrid search with keyword-only weighting."""
+        """Test hybrid search with non-normalized and single-signal weights."""
+        # Non-normalized weights only log a warning
         results = await service.hybrid_search(
             query_text="machine learning",
             query_embedding=sample_embeddings["base"],
             limit=5,
-            vector_weight=0.0,
-            keyword_weight=1.0,
+            vector_weight=vector_weight,
+            keyword_weight=keyword_weight,
         )
 
-        # Should work like pure keyword search
         assert len(results) > 0
 
     @pytest.mark.asyncio
@@ -430,18 +409,11 @@ class TestVectorSearchFactory:
 class TestVectorSearchEdgeCases:
     """Test edge cases and error handling."""
 
-    @pytest.fixture
-    def service(self):
-        """Create vector search service."""
-        return VectorSearchService()
-
     @pytest.mark.asyncio
-    async def test_empty_database(self, service):
+    async def test_empty_database(self, service, db_transaction):
         """Test search with empty database."""
-        # Clear all content first
-        async with get_db_session() as session:
-            await session.execute("DELETE FROM content")
-            await session.commit()
+        # Clear all content first; db_transaction rolls the truncate back
+        await db_transaction.execute(text("TRUNCATE content CASCADE"))
 
         embedding = [0.1] * 1536
         results = await service.similarity_search(
@@ -10,6 +10,7 @@ Run: python validate_phase4.py
 """
 
 import asyncio
+import functools
 import sys
 from uuid import uuid4
 
@@ -24,6 +25,15 @@ from src.modules.content.db_service import DatabaseContentService
 from src.shared.feature_flags import FeatureFlags, get_feature_flags
 from src.shared.config import get_settings
 
+VECTOR_SEARCH_METHODS = (
+    "similarity_search",
+    "similarity_search_with_content",
+    "find_similar_to_content",
+    "hybrid_search",
+    "get_index_stats",
+)
+CONTENT_SERVICE_METHODS = ("search_content", "vector_search_content", "process_content")
+
 
 def print_section(title: str):
     """Print a formatted section header."""
@@ -47,191 +57,171 @@ def print_warning(message: str):
     print(f"[WARN] {message}")
 
 
+def validator(title: str, name: str):
+    """Print the section header and report any exception as a failed check."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper():
+            print_section(title)
+            try:
+                return await func()
+            except Exception as e:
+                print_error(f"{name} validation failed: {e}")
+                return False
+        return wrapper
+    return decorator
+
+
+@validator("Placeholder Embedding Service", "Placeholder embedding")
 async def validate_placeholder_embedding():
     """Validate placeholder embedding service."""
-    print_section("Placeholder Embedding Service")
+    service = PlaceholderEmbedding()
 
-    try:
-        service = PlaceholderEmbedding()
-
-        # Test dimension
-        assert service.dimension == EMBEDDING_DIMENSION
-        print_success(f"Dimension correct: {service.dimension}")
-
-        # Test single embedding
-        text = "Test embedding generation"
-        embedding = await service.generate(text)
-        assert len(embedding) == EMBEDDING_DIMENSION
-        assert all(isinstance(x, float) for x in embedding)
-        print_success(f"Single embedding generated: {len(embedding)} dimensions")
-
-        # Test deterministic
-        embedding2 = await service.generate(text)
-        assert embedding == embedding2
-        print_success("Embeddings are deterministic")
-
-        # Test batch
-        texts = ["First", "Second", "Third"]
-        embeddings = await service.batch_generate(texts)
-        assert len(embeddings) == len(texts)
-        print_success(f"Batch embeddings generated: {len(embeddings)} items")
+    # Test dimension
+    assert service.dimension == EMBEDDING_DIMENSION
+    print_success(f"Dimension correct: {service.dimension}")
 
-        return True
-    except Exception as e:
-        print_error(f"Placeholder embedding validation failed: {e}")
-        return False
+    # Test single embedding
+    text = "Test embedding generation"
+    embedding = await service.generate(text)
+    assert len(embedding) == EMBEDDING_DIMENSION
+    assert set(map(type, embedding)) == {float}
+    print_success(f"Single embedding generated: {len(embedding)} dimensions")
+
+    # Test deterministic
+    embedding2 = await service.generate(text)
+    assert embedding == embedding2
+    print_success("Embeddings are deterministic")
+
+    # Test batch
+    texts = ["First", "Second", "Third"]
+    embeddings = await service.batch_generate(texts)
+    assert len(embeddings) == len(texts)
+    print_success(f"Batch embeddings generated: {len(embeddings)} items")
+
+    return True
 
 
+@validator("OpenAI Embedding Service", "OpenAI embedding")
 async def validate_openai_embedding():
     """Validate OpenAI embedding service (mock mode)."""
-    print_section("OpenAI Embedding Service")
+    settings = get_settings()
 
-    try:
-        settings = get_settings()
-
-        if not settings.openai_api_key:
-            print_warning("OpenAI API key not configured (this is OK for testing)")
-            print_warning("Set OPENAI_API_KEY to test real embeddings")
-            return True
+    if not settings.openai_api_key:
+        print_warning("OpenAI API key not configured (this is OK for testing)")
+        print_warning("Set OPENAI_API_KEY to test real embeddings")
+        return True
 
-        # Don't actually call API in validation
-        service = OpenAIEmbedding(api_key=settings.openai_api_key)
-        assert service.dimension == EMBEDDING_DIMENSION
-        print_success(f"OpenAI service initialized with dimension: {service.dimension}")
+    # Don't actually call API in validation
+    service = OpenAIEmbedding(api_key=settings.openai_api_key)
+    assert service.dimension == EMBEDDING_DIMENSION
+    print_success(f"OpenAI service initialized with dimension: {service.dimension}")
 
-        print_warning("Skipping real API calls in validation (to avoid costs)")
-        print_warning("Run integration tests to validate API calls")
+    print_warning("Skipping real API calls in validation (to avoid costs)")
+    print_warning("Run integration tests to validate API calls")
 
-        return True
-    except Exception as e:
-        print_error(f"OpenAI embedding validation failed: {e}")
-        return False
+    return True
 
 
+@validator("Embedding Service Factory", "Embedding factory")
 async def validate_embedding_factory():
     """Validate embedding service factory."""
-    print_section("Embedding Service Factory")
-
-    try:
-        flags = get_feature_flags()
-        settings = get_settings()
-
-        # Test with flag disabled
-        flags.disable(FeatureFlags.ENABLE_REAL_EMBEDDINGS)
-        service = get_embedding_service(force_reload=True)
+    flags = get_feature_flags()
+    settings = get_settings()
+
+    # Test with flag disabled
+    flags.disable(FeatureFlags.ENABLE_REAL_EMBEDDINGS)
+    service = get_embedding_service(force_reload=True)
+    assert isinstance(service, PlaceholderEmbedding)
+    print_success("Factory returns PlaceholderEmbedding when flag disabled")
+
+    # Test with flag enabled (falls back to placeholder without an API key)
+    flags.enable(FeatureFlags.ENABLE_REAL_EMBEDDINGS)
+    service = get_embedding_service(force_reload=True)
+    if not settings.openai_api_key:
         assert isinstance(service, PlaceholderEmbedding)
-        print_success("Factory returns PlaceholderEmbedding when flag disabled")
-
-        # Test with flag enabled but no API key
-        flags.enable(FeatureFlags.ENABLE_REAL_EMBEDDINGS)
-        if not settings.openai_api_key:
-            service = get_embedding_service(force_reload=True)
-            assert isinstance(service, PlaceholderEmbedding)
-            print_success("Factory returns PlaceholderEmbedding when API key missing")
-        else:
-            service = get_embedding_service(force_reload=True)
-            assert isinstance(service, OpenAIEmbedding)
-            print_success("Factory returns OpenAIEmbedding when enabled and key present")
+        print_success("Factory returns PlaceholderEmbedding when API key missing")
+    else:
+        assert isinstance(service, OpenAIEmbedding)
+        print_success("Factory returns OpenAIEmbedding when enabled and key present")
 
-        # Reset flag
-        flags.clear_all_overrides()
+    # Reset flag
+    flags.clear_all_overrides()
 
-        return True
-    except Exception as e:
-        print_error(f"Embedding factory validation failed: {e}")
-        return False
+    return True
 
 
+@validator("Vector Search Service", "Vector search")
 async def validate_vector_search():
     """Validate vector search service."""
-    print_section("Vector Search Service")
+    service = get_vector_search_service()
+    print_success("Vector search service initialized")
 
-    try:
-        service = get_vector_search_service()
-        print_success("Vector search service initialized")
-
-        # Test that methods exist
-        assert hasattr(service, 'similarity_search')
-        assert hasattr(service, 'similarity_search_with_content')
-        assert hasattr(service, 'find_similar_to_content')
-        assert hasattr(service, 'hybrid_search')
-        assert hasattr(service, 'get_index_stats')
-        print_success("All vector search methods available")
-
-        # Test dimension validation
-        try:
-            await service.similarity_search(
-                query_embedding=[0.1] * 100,  # Wrong dimension
-                limit=10
-            )
-            print_error("Should have raised dimension error")
-            return False
-        except ValueError as e:
-            if "1536 dimensions" in str(e):
-                print_success("Dimension validation working correctly")
-            else:
-                raise
+    # Test that methods exist
+    missing = [name for name in VECTOR_SEARCH_METHODS if not hasattr(service, name)]
+    assert not missing, f"missing methods: {', '.join(missing)}"
+    print_success("All vector search methods available")
 
-        return True
-    except Exception as e:
-        print_error(f"Vector search validation failed: {e}")
+    # Test dimension validation
+    try:
+        await service.similarity_search(
+            query_embedding=[0.1] * 100,  # Wrong dimension
+            limit=10
+        )
+        print_error("Should have raised dimension error")
         return False
+    except ValueError as e:
+        if "1536 dimensions" in str(e):
+            print_success("Dimension validation working correctly")
+        else:
+            raise
 
+    return True
 
+
+@validator("Content Service Integration", "Content service integration")
 async def validate_content_service_integration():
     """Validate content service integration."""
-    print_section("Content Service Integration")
+    service = DatabaseContentService(
+        embedding_service=PlaceholderEmbedding()
+    )
+    print_success("DatabaseContentService initialized with embedding service")
 
-    try:
-        service = DatabaseContentService(
-            embedding_service=PlaceholderEmbedding()
-        )
-        print_success("DatabaseContentService initialized with embedding service")
+    # Check methods exist
+    missing = [name for name in CONTENT_SERVICE_METHODS if not hasattr(service, name)]
+    assert not missing, f"missing methods: {', '.join(missing)}"
+    print_success("All required methods available")
 
-        # Check methods exist
-        assert hasattr(service, 'search_content')
-        assert hasattr(service, 'vector_search_content')
-        assert hasattr(service, 'process_content')
-        print_success("All required methods available")
+    # Test embedding generation (without DB)
+    test_embedding = await service._generate_embedding("Test text")
+    assert len(test_embedding) == EMBEDDING_DIMENSION
+    print_success(f"Embedding generation working: {len(test_embedding)} dimensions")
 
-        # Test embedding generation (without DB)
-        test_embedding = await service._generate_embedding("Test text")
-        assert len(test_embedding) == EMBEDDING_DIMENSION
-        print_success(f"Embedding generation working: {len(test_embedding)} dimensions")
-
-        return True
-    except Exception as e:
-        print_error(f"Content service integration validation failed: {e}")
-        return False
+    return True
 
 
+@validator("Feature Flag Integration", "Feature flag")
 async def validate_feature_flags():
     """Validate feature flag integration."""
-    print_section("Feature Flag Integration")
+    flags = get_feature_flags()
 
-    try:
-        flags = get_feature_flags()
+    # Test flag exists
+    assert hasattr(FeatureFlags, 'ENABLE_REAL_EMBEDDINGS')
+    print_success("ENABLE_REAL_EMBEDDINGS flag exists")
 
-        # Test flag exists
-        assert hasattr(FeatureFlags, 'ENABLE_REAL_EMBEDDINGS')
-        print_success("ENABLE_REAL_EMBEDDINGS flag exists")
+    # Test flag operations
+    flags.enable(FeatureFlags.ENABLE_REAL_EMBEDDINGS)
+    assert flags.is_enabled(FeatureFlags.ENABLE_REAL_EMBEDDINGS)
+    print_success("Flag enable/check working")
 
-        # Test flag operations
-        flags.enable(FeatureFlags.ENABLE_REAL_EMBEDDINGS)
-        assert flags.is_enabled(FeatureFlags.ENABLE_REAL_EMBEDDINGS)
-        print_success("Flag enable/check working")
+    flags.disable(FeatureFlags.ENABLE_REAL_EMBEDDINGS)
+    assert not flags.is_enabled(FeatureFlags.ENABLE_REAL_EMBEDDINGS)
+    print_success("Flag disable working")
 
-        flags.disable(FeatureFlags.ENABLE_REAL_EMBEDDINGS)
-        assert not flags.is_enabled(FeatureFlags.ENABLE_REAL_EMBEDDINGS)
-        print_success("Flag disable working")
+    # Reset
+    flags.clear_all_overrides()
 
-        # Reset
-        flags.clear_all_overrides()
-
-        return True
-    except Exception as e:
-        print_error(f"Feature flag validation failed: {e}")
-        return False
+    return True
 
 
 async def main():
@@ -241,20 +231,33 @@ async def main():
     print("=" * 60)
     print("\nValidating implementation components...\n")
 
-    results = []
-
-    # Run all validations
-    results.append(("Placeholder Embedding", await validate_placeholder_embedding()))
-    results.append(("OpenAI Embedding", await validate_openai_embedding()))
-    results.append(("Embedding Factory", await validate_embedding_factory()))
-    results.append(("Vector Search", await validate_vector_search()))
-    results.append(("Content Service", await validate_content_service_integration()))
-    results.append(("Feature Flags", await validate_feature_flags()))
+    # Run the independent validations concurrently; @validator reports
+    # exceptions, so each one resolves to a bool
+    placeholder, openai, vector_search, content_service = await asyncio.gather(
+        validate_placeholder_embedding(),
+        validate_openai_embedding(),
+        validate_vector_search(),
+        validate_content_service_integration(),
+    )
+
+    # These toggle the global feature flags, so run them one at a time
+    embedding_factory = await validate_embedding_factory()
+    feature_flags = await validate_feature_flags()
+
+    results = [
+        ("Placeholder Embedding", placeholder),
+        ("OpenAI Embedding", openai),
+        ("Embedding Factory", embedding_factory),
+        ("Vector Search", vector_search),
+        ("Content Service", content_service),
+        ("Feature Flags", feature_flags),
+    ]
+    results = [(name, result is True) for name, result in results]
 
     # Summary
     print_section("Validation Summary")
 
-    passed = sum(1 for _, result in results if result)
+    passed = sum(result for _, result in results)
     total = len(results)
 
     for name, result in results: